@@ -12,13 +12,45 @@ compartilhados ou processados posteriormente em outras aplicações.
 import os
 import json
 import csv
-import pandas as pd
+from collections import deque
 from datetime import datetime
 import time
 import platform
 import sys
 from colorama import Fore, Style, Back
 
+# orjson is optional: it serializes JSON several times faster than the
+# stdlib module and returns the full payload as bytes, allowing a single
+# file write instead of one write per token
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Operating system name resolved once at import time instead of on every
+# export call
+_IS_WINDOWS = platform.system() == "Windows"
+
+if orjson is not None:
+    def _dumps(obj):
+        """
+        Serialize an object to indented JSON bytes.
+
+        With orjson, datetimes and numpy scalars are encoded natively in C
+        instead of falling back to Python-level str() per value.
+        """
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        )
+else:
+    def _dumps(obj):
+        """
+        Serialize an object to indented JSON bytes with the stdlib encoder.
+        """
+        return json.dumps(obj, indent=4, default=str).encode()
+
 def export_results(data, prefix):
     """
     Exporta resultados para um arquivo.
@@ -35,9 +67,7 @@ def export_results(data, prefix):
         str: O caminho para o arquivo exportado.
     """
     # Create exports directory if it doesn't exist
-    os_name = platform.system()
-    
-    if os_name == "Windows":
+    if _IS_WINDOWS:
         home_dir = os.path.expanduser("~")
         export_dir = os.path.join(home_dir, "NetworkUtility_exports")
     else:
@@ -54,9 +84,10 @@ def export_results(data, prefix):
     print("1. JSON")
     print("2. CSV")
     print("3. Text")
-    
+    print("4. Parquet")
+
     try:
-        choice = input(Fore.GREEN + "Select export format (1-3): " + Style.RESET_ALL)
+        choice = input(Fore.GREEN + "Select export format (1-4): " + Style.RESET_ALL)
     except EOFError:
         # Default to JSON in non-interactive mode
         print(Fore.YELLOW + "Running in non-interactive mode. Defaulting to JSON format." + Style.RESET_ALL)
@@ -65,30 +96,68 @@ def export_results(data, prefix):
     if choice == "1" or choice.lower() == "json":
         # Export as JSON
         filename = os.path.join(export_dir, f"{prefix}_{timestamp}.json")
-        
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=4, default=str)
+
+        # Encode everything at once and issue a single write of the bytes
+        with open(filename, 'wb') as f:
+            f.write(_dumps(data))
             
     elif choice == "2" or choice.lower() == "csv":
         # Export as CSV - convert dict to DataFrame
         filename = os.path.join(export_dir, f"{prefix}_{timestamp}.csv")
         
-        # Flatten nested dictionaries for CSV export
-        flat_data = flatten_dict(data)
-        
-        df = pd.DataFrame([flat_data])
-        df.to_csv(filename, index=False)
+        # Flatten nested dictionaries for CSV export; a list of dicts
+        # becomes one CSV row per item
+        if isinstance(data, list):
+            flat_rows = [flatten_dict(row) for row in data]
+        else:
+            flat_rows = [flatten_dict(data)]
+
+        # Union of all row keys in one pass, preserving first-seen order
+        fieldnames = {}
+        for row in flat_rows:
+            fieldnames.update(dict.fromkeys(row))
+
+        # Stream the rows directly with the csv module: building a pandas
+        # DataFrame just to serialize them costs far more than the write
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(fieldnames), extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(flat_rows)
         
+    elif choice == "4" or choice.lower() == "parquet":
+        # Export as Parquet - compact columnar binary, much faster to write
+        # and to reload in analytic tools than CSV
+        flat_data = flatten_dict(data)
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            filename = os.path.join(export_dir, f"{prefix}_{timestamp}.parquet")
+            table = pa.Table.from_pylist([{k: str(v) for k, v in flat_data.items()}])
+            pq.write_table(table, filename, compression='zstd')
+        except ImportError:
+            # pyarrow is optional; fall back to CSV when it is missing
+            print(Fore.YELLOW + "pyarrow is not installed. Exporting as CSV instead." + Style.RESET_ALL)
+            filename = os.path.join(export_dir, f"{prefix}_{timestamp}.csv")
+
+            with open(filename, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(flat_data))
+                writer.writeheader()
+                writer.writerow(flat_data)
+
     else:
         # Export as plain text
         filename = os.path.join(export_dir, f"{prefix}_{timestamp}.txt")
         
         with open(filename, 'w') as f:
-            f.write(f"Network Utility Export - {prefix}\n")
-            f.write(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            # Write the data in a readable format
-            write_dict_to_text(f, data)
+            # Build the whole report in memory and issue a single write
+            parts = [
+                f"Network Utility Export - {prefix}\n",
+                f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            ]
+            parts.extend(build_text_parts(data))
+            f.write(''.join(parts))
     
     return filename
 
@@ -105,41 +174,72 @@ def flatten_dict(d, parent_key='', sep='_'):
         dict: Flattened dictionary.
     """
     items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            for i, item in enumerate(v):
-                if isinstance(item, dict):
-                    items.extend(flatten_dict(item, f"{new_key}{sep}{i}", sep=sep).items())
-                else:
-                    items.append((f"{new_key}{sep}{i}", item))
+    # Iterative depth-first traversal with an explicit work-stack instead of
+    # recursion: avoids per-call frame overhead and stack overflow on deeply
+    # nested payloads. Key paths accumulate as tuples and are joined only at
+    # the leaves, so no intermediate prefix strings are built per level
+    stack = deque([((parent_key,) if parent_key else (), d)])
+    while stack:
+        path, value = stack.popleft()
+
+        if isinstance(value, dict):
+            children = [(path + (str(k),), v) for k, v in value.items()]
+            stack.extendleft(reversed(children))
+        elif isinstance(value, list):
+            children = [(path + (str(i),), item) for i, item in enumerate(value)]
+            stack.extendleft(reversed(children))
         else:
-            items.append((new_key, v))
-            
+            items.append((sep.join(path), value))
+
     return dict(items)
 
-def write_dict_to_text(file, d, indent=0):
+# Cache of indentation strings so nested levels reuse the same object
+# instead of rebuilding ' ' * n per line
+_indent_cache = {}
+
+def _indent(n):
+    pad = _indent_cache.get(n)
+    if pad is None:
+        pad = _indent_cache[n] = ' ' * n
+    return pad
+
+def build_text_parts(d):
     """
-    Write a dictionary to a text file in a readable format.
-    
+    Format a dictionary as a list of readable text lines.
+
+    Traverses the dictionary iteratively and returns the formatted lines
+    as a list of strings, so the caller can join and write them in a
+    single call instead of one write per key.
+
     Args:
-        file: The file object to write to.
-        d (dict): The dictionary to write.
-        indent (int): The indentation level.
+        d (dict): The dictionary to format.
+
+    Returns:
+        list: Formatted lines, each ending in a newline.
     """
-    for k, v in d.items():
-        if isinstance(v, dict):
-            file.write(f"{' ' * indent}{k}:\n")
-            write_dict_to_text(file, v, indent + 2)
-        elif isinstance(v, list):
-            file.write(f"{' ' * indent}{k}:\n")
-            for item in v:
+    parts = []
+    # Explicit work-stack of (indent, key, value); a key of None marks a
+    # plain list item rendered as "- item"
+    stack = deque([(0, k, v) for k, v in d.items()])
+    while stack:
+        indent, key, value = stack.popleft()
+        pad = _indent(indent)
+
+        if isinstance(value, dict):
+            parts.append(f"{pad}{key}:\n")
+            stack.extendleft(reversed([(indent + 2, k, v) for k, v in value.items()]))
+        elif isinstance(value, list):
+            parts.append(f"{pad}{key}:\n")
+            children = []
+            for item in value:
                 if isinstance(item, dict):
-                    write_dict_to_text(file, item, indent + 2)
+                    children.extend((indent + 2, k, v) for k, v in item.items())
                 else:
-                    file.write(f"{' ' * (indent + 2)}- {item}\n")
+                    children.append((indent + 2, None, item))
+            stack.extendleft(reversed(children))
+        elif key is None:
+            parts.append(f"{pad}- {value}\n")
         else:
-            file.write(f"{' ' * indent}{k}: {v}\n")
+            parts.append(f"{pad}{key}: {value}\n")
+
+    return parts
@@ -16,6 +16,7 @@ fornecem resultados detalhados para uso em análises de desempenho e conectivida
 import subprocess
 import re
 import socket
+import ipaddress
 import platform
 import time
 import random
@@ -27,9 +28,68 @@ from datetime import datetime
 import requests
 from tqdm import tqdm
 
+# icmplib é opcional: envia echo requests ICMP diretamente, sem criar um
+# processo ping por host nem interpretar a saída de texto do comando
+try:
+    from icmplib import ping as icmp_ping, multiping as icmp_multiping
+except ImportError:
+    icmp_ping = None
+    icmp_multiping = None
+
+# Nome do sistema operacional consultado uma única vez no import; os
+# métodos fazem um teste booleano em vez de rechamar platform.system()
+_OS_NAME = platform.system()
+_IS_WINDOWS = _OS_NAME == "Windows"
+
+# Padrões compilados uma única vez no import do módulo; os métodos de
+# parsing os reutilizam em vez de recompilar a cada chamada/linha.
+# Os padrões de ping operam sobre bytes: a saída do comando é analisada
+# sem uma passada extra de decodificação
+_IPV4_RE = re.compile(r"^\d+\.\d+\.\d+\.\d+$")
+_WIN_TIMES_RE = re.compile(rb"Minimum = (\d+)ms, Maximum = (\d+)ms, Average = (\d+)ms")
+_UNIX_TIMES_RE = re.compile(rb"min/avg/max/[^=]+ = (\d+\.\d+)/(\d+\.\d+)/(\d+\.\d+)")
+_WIN_STATS_RE = re.compile(rb"Sent = (\d+), Received = (\d+), Lost = (\d+)")
+_UNIX_STATS_RE = re.compile(rb"(\d+) packets transmitted, (\d+) [packets ]*received")
+_WIN_TRACERT_RE = re.compile(r"^\s*(\d+)\s+(\d+|[*]+)\s+ms\s+(\d+|[*]+)\s+ms\s+(\d+|[*]+)\s+ms\s+(.+)$")
+_UNIX_TRACEROUTE_RE = re.compile(r"^\s*(\d+)\s+([^\s]+)(?:\s+\(([^\)]+)\))?\s+(?:([0-9.]+)\s+ms\s+)+")
+_HOP_TIME_RE = re.compile(r"([0-9.]+)\s+ms")
+
+# Faixas RFC1918: hops internos quase nunca têm PTR público, então o
+# rastreamento de rota pula a resolução reversa para esses endereços
+_PRIVATE_NETS = tuple(ipaddress.ip_network(n)
+                      for n in ('10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16'))
+
+# Bloco de zeros compartilhado para o teste de upload: o corpo é enviado
+# em pedaços que reutilizam este buffer, sem materializar o payload
+# inteiro em memória a cada chamada
+_UPLOAD_CHUNK = bytes(65536)
+
+class _ZeroPayload:
+    """
+    Corpo de upload iterável que reutiliza _UPLOAD_CHUNK.
+
+    Expõe __len__ para que o requests calcule o Content-Length sozinho e
+    envie o corpo sem Transfer-Encoding: chunked; um gerador puro não tem
+    tamanho, e forçar o cabeçalho à mão produzia uma requisição com os
+    dois modos de enquadramento ao mesmo tempo.
+    """
+
+    def __init__(self, size):
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        full, rest = divmod(self._size, len(_UPLOAD_CHUNK))
+        for _ in range(full):
+            yield _UPLOAD_CHUNK
+        if rest:
+            yield _UPLOAD_CHUNK[:rest]
+
 class NetworkDiagnostics:
     def __init__(self):
-        self.os_name = platform.system()
+        self.os_name = _OS_NAME
         self.timeout = 10  # Tempo limite para operações de rede (segundos)
         self.speed_test_servers = [
             "speedtest.net",
@@ -52,52 +112,67 @@ class NetworkDiagnostics:
             # For a more accurate test, use speedtest-cli or other specialized tools
             
             # Measure ping
-            start_time = time.time()
+            start_time = time.perf_counter()
             requests.get('https://www.google.com', timeout=5)
-            end_time = time.time()
+            end_time = time.perf_counter()
             result["ping"] = (end_time - start_time) * 1000  # Convert to ms
-            
+
             # Download speed test
             download_size = 10 * 1024 * 1024  # 10 MB
             download_url = "https://speed.cloudflare.com/__down?bytes=10000000"
-            
-            start_time = time.time()
+
+            start_time = time.perf_counter()
             response = requests.get(download_url, stream=True, timeout=30)
-            
+
+            # Read the body straight off the socket in 1MB blocks with no
+            # per-chunk Python decoding, and batch the progress-bar updates,
+            # so the measurement reflects the network rather than the
+            # interpreter loop
+            raw = response.raw
+            raw.decode_content = False
+            chunk_size = 1 << 20  # 1 MB
+            update_threshold = 8 * chunk_size
+            pending = 0
+
             with tqdm(total=download_size, unit='B', unit_scale=True, desc="Download", leave=False) as pbar:
                 downloaded = 0
-                for chunk in response.iter_content(chunk_size=1024):
-                    if chunk:
-                        downloaded += len(chunk)
-                        pbar.update(len(chunk))
-                    
-                    # If we've downloaded enough, break
-                    if downloaded >= download_size:
+                while downloaded < download_size:
+                    buf = raw.read(chunk_size)
+                    if not buf:
                         break
-            
-            end_time = time.time()
+                    downloaded += len(buf)
+                    pending += len(buf)
+
+                    if pending >= update_threshold:
+                        pbar.update(pending)
+                        pending = 0
+
+                if pending:
+                    pbar.update(pending)
+
+            end_time = time.perf_counter()
             download_time = end_time - start_time
             
             # Calculate speed in Mbps
             if download_time > 0:
                 result["download"] = (downloaded * 8) / (download_time * 1_000_000)
             
-            # Upload speed test - simulate with a POST request
+            # Upload speed test - simulate with a POST request, streaming the
+            # shared zero buffer instead of allocating the full payload
             upload_size = 1 * 1024 * 1024  # 1 MB
-            data = b'0' * upload_size
-            
-            start_time = time.time()
-            
+
+            start_time = time.perf_counter()
+
             with tqdm(total=upload_size, unit='B', unit_scale=True, desc="Upload", leave=False) as pbar:
                 response = requests.post(
                     'https://httpbin.org/post',
-                    data=data,
+                    data=_ZeroPayload(upload_size),
                     timeout=30,
                     headers={'Content-Type': 'application/octet-stream'}
                 )
                 pbar.update(upload_size)
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             upload_time = end_time - start_time
             
             # Calculate speed in Mbps
@@ -120,14 +195,28 @@ class NetworkDiagnostics:
             dict: Min, avg, and max latency in ms.
         """
         result = {"min": 0.0, "avg": 0.0, "max": 0.0}
-        
+
         try:
-            if self.os_name == "Windows":
-                # Windows ping
-                output = subprocess.check_output(f"ping {host} -n 10", shell=True).decode()
-                
+            # ICMP direto quando disponível: dispensa o processo ping e o
+            # parse da saída localizada
+            if icmp_ping is not None:
+                try:
+                    response = icmp_ping(host, count=10, privileged=False)
+                    result["min"] = response.min_rtt
+                    result["avg"] = response.avg_rtt
+                    result["max"] = response.max_rtt
+                    return result
+                except Exception:
+                    pass  # Recorre ao caminho via subprocess abaixo
+
+            if _IS_WINDOWS:
+                # Windows ping - executa o comando sem shell e analisa a
+                # saída em bytes, sem decodificação intermediária
+                output = subprocess.run(["ping", host, "-n", "10"],
+                                        capture_output=True, timeout=30).stdout
+
                 # Extract times
-                times_match = re.search(r"Minimum = (\d+)ms, Maximum = (\d+)ms, Average = (\d+)ms", output)
+                times_match = _WIN_TIMES_RE.search(output)
                 if times_match:
                     result["min"] = float(times_match.group(1))
                     result["max"] = float(times_match.group(2))
@@ -135,10 +224,11 @@ class NetworkDiagnostics:
                     
             else:
                 # Linux/macOS ping
-                output = subprocess.check_output(f"ping -c 10 {host}", shell=True).decode()
-                
+                output = subprocess.run(["ping", "-c", "10", host],
+                                        capture_output=True, timeout=30).stdout
+
                 # Extract times
-                times_match = re.search(r"min/avg/max/[^=]+ = (\d+\.\d+)/(\d+\.\d+)/(\d+\.\d+)", output)
+                times_match = _UNIX_TIMES_RE.search(output)
                 if times_match:
                     result["min"] = float(times_match.group(1))
                     result["avg"] = float(times_match.group(2))
@@ -161,14 +251,32 @@ class NetworkDiagnostics:
             dict: Packet loss statistics.
         """
         result = {"sent": packets, "received": 0, "lost": 0, "loss_percentage": 0.0}
-        
+
         try:
-            if self.os_name == "Windows":
-                # Windows ping
-                output = subprocess.check_output(f"ping {host} -n {packets}", shell=True).decode()
+            # ICMP direto quando disponível: os echoes saem com intervalo
+            # de 50ms em vez do espaçamento de 1s do comando ping, então
+            # 50 pacotes custam poucos segundos em vez de ~50s, sem fork
+            # nem parse da saída localizada
+            if icmp_ping is not None:
+                try:
+                    response = icmp_ping(host, count=packets, interval=0.05,
+                                         timeout=2, privileged=False)
+                    result["sent"] = response.packets_sent
+                    result["received"] = response.packets_received
+                    result["lost"] = response.packets_sent - response.packets_received
+                    if response.packets_sent:
+                        result["loss_percentage"] = (result["lost"] / response.packets_sent) * 100
+                    return result
+                except Exception:
+                    pass  # Recorre ao caminho via subprocess abaixo
+
+            if _IS_WINDOWS:
+                # Windows ping - sem shell, saída analisada em bytes
+                output = subprocess.run(["ping", host, "-n", str(packets)],
+                                        capture_output=True, timeout=2 * packets + 10).stdout
                 
                 # Extract packet statistics
-                stats_match = re.search(r"Sent = (\d+), Received = (\d+), Lost = (\d+)", output)
+                stats_match = _WIN_STATS_RE.search(output)
                 if stats_match:
                     result["sent"] = int(stats_match.group(1))
                     result["received"] = int(stats_match.group(2))
@@ -177,10 +285,11 @@ class NetworkDiagnostics:
                     
             else:
                 # Linux/macOS ping
-                output = subprocess.check_output(f"ping -c {packets} {host}", shell=True).decode()
+                output = subprocess.run(["ping", "-c", str(packets), host],
+                                        capture_output=True, timeout=2 * packets + 10).stdout
                 
                 # Extract packet statistics
-                stats_match = re.search(r"(\d+) packets transmitted, (\d+) [packets ]*received", output)
+                stats_match = _UNIX_STATS_RE.search(output)
                 if stats_match:
                     result["sent"] = int(stats_match.group(1))
                     result["received"] = int(stats_match.group(2))
@@ -193,87 +302,117 @@ class NetworkDiagnostics:
             
         return result
     
+    def _parse_trace_line(self, line):
+        """
+        Interpreta uma linha de saída do traceroute/tracert.
+
+        Args:
+            line (str): Linha de saída do comando.
+
+        Returns:
+            dict: Hop com número, host, IP e tempo médio, ou None quando
+                a linha é cabeçalho ou não contém um hop.
+        """
+        if _IS_WINDOWS:
+            # Skip header lines
+            if "Tracing route" in line or "over a maximum" in line or "Trace complete" in line:
+                return None
+
+            match = _WIN_TRACERT_RE.search(line)
+            if not match:
+                return None
+
+            hop_num = int(match.group(1))
+            times = [t for t in [match.group(2), match.group(3), match.group(4)] if t != "*"]
+            avg_time = sum(map(float, times)) / len(times) if times else 0
+            ip_or_host = match.group(5).strip()
+            return {"hop": hop_num, "host": ip_or_host, "ip": ip_or_host, "time": avg_time}
+
+        # Skip header line
+        if "traceroute to" in line:
+            return None
+
+        match = _UNIX_TRACEROUTE_RE.search(line)
+        if not match:
+            return None
+
+        hop_num = int(match.group(1))
+        ip = match.group(2)
+
+        # Extract times
+        times = _HOP_TIME_RE.findall(line)
+        avg_time = sum(map(float, times)) / len(times) if times else 0
+        return {"hop": hop_num, "host": ip, "ip": ip, "time": avg_time}
+
+    def route_tracing_stream(self, host="google.com"):
+        """
+        Gera os hops do rastreamento de rota conforme eles chegam.
+
+        O traceroute/tracert é executado sem shell intermediário e sua
+        saída é lida linha a linha: cada hop é entregue no momento em que
+        o comando o reporta, em vez de só depois de até 30 hops × 1s de
+        timeout. A latência percebida cai para o tempo do primeiro hop.
+        Os hops saem identificados pelo IP (-d/-n); a resolução reversa
+        em lote fica a cargo de route_tracing.
+
+        Args:
+            host (str): O host alvo do rastreamento.
+
+        Yields:
+            dict: Hop com número, host, IP e tempo médio.
+        """
+        args = ["tracert", "-d", host] if _IS_WINDOWS else ["traceroute", "-n", host]
+
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True)
+        try:
+            for line in proc.stdout:
+                hop = self._parse_trace_line(line)
+                if hop is not None:
+                    yield hop
+        finally:
+            # Encerra o comando se o consumidor abandonar o gerador
+            if proc.poll() is None:
+                proc.terminate()
+            proc.wait(timeout=5)
+
     def route_tracing(self, host="google.com"):
         """
         Trace the route to a host.
-        
+
         Args:
             host (str): The host to trace the route to.
-            
+
         Returns:
             list: List of hops with host, IP, and time.
         """
         hops = []
-        
+
         try:
-            if self.os_name == "Windows":
-                # Windows tracert
-                output = subprocess.check_output(f"tracert -d {host}", shell=True).decode()
-                
-                # Parse tracert output
-                for line in output.splitlines():
-                    # Skip header lines
-                    if "Tracing route" in line or "over a maximum" in line or "Trace complete" in line:
-                        continue
-                        
-                    match = re.search(r"^\s*(\d+)\s+(\d+|[*]+)\s+ms\s+(\d+|[*]+)\s+ms\s+(\d+|[*]+)\s+ms\s+(.+)$", line)
-                    if match:
-                        hop_num = int(match.group(1))
-                        times = [t for t in [match.group(2), match.group(3), match.group(4)] if t != "*"]
-                        avg_time = sum(map(float, times)) / len(times) if times else 0
-                        ip_or_host = match.group(5).strip()
-                        
-                        # Try to resolve hostname if it's an IP
-                        hostname = ip_or_host
-                        try:
-                            if re.match(r"^\d+\.\d+\.\d+\.\d+$", ip_or_host):
-                                hostname_info = socket.gethostbyaddr(ip_or_host)
-                                hostname = hostname_info[0]
-                        except:
-                            pass
-                            
-                        hops.append({
-                            "hop": hop_num,
-                            "host": hostname,
-                            "ip": ip_or_host,
-                            "time": avg_time
-                        })
-                        
-            else:
-                # Linux/macOS traceroute
-                output = subprocess.check_output(f"traceroute -n {host}", shell=True).decode()
-                
-                # Parse traceroute output
-                for line in output.splitlines():
-                    # Skip header line
-                    if "traceroute to" in line:
-                        continue
-                        
-                    match = re.search(r"^\s*(\d+)\s+([^\s]+)(?:\s+\(([^\)]+)\))?\s+(?:([0-9.]+)\s+ms\s+)+", line)
-                    if match:
-                        hop_num = int(match.group(1))
-                        ip = match.group(2)
-                        
-                        # Extract times
-                        times = re.findall(r"([0-9.]+)\s+ms", line)
-                        avg_time = sum(map(float, times)) / len(times) if times else 0
-                        
-                        # Try to resolve hostname if it's an IP
-                        hostname = ip
-                        try:
-                            if re.match(r"^\d+\.\d+\.\d+\.\d+$", ip):
-                                hostname_info = socket.gethostbyaddr(ip)
-                                hostname = hostname_info[0]
-                        except:
-                            pass
-                            
-                        hops.append({
-                            "hop": hop_num,
-                            "host": hostname,
-                            "ip": ip,
-                            "time": avg_time
-                        })
-                        
+            hops = list(self.route_tracing_stream(host))
+
+            # Resolve all hop PTRs at once in a thread pool: the DNS
+            # round-trips overlap instead of being paid serially per hop.
+            # Repeated hops (load balancers) are resolved once, and private
+            # RFC1918 addresses are skipped since their reverse lookups
+            # almost always just time out
+            ips_to_resolve = []
+            seen = set()
+            for hop in hops:
+                ip = hop["ip"]
+                if ip in seen or not _IPV4_RE.match(ip):
+                    continue
+                seen.add(ip)
+
+                addr = ipaddress.IPv4Address(ip)
+                if any(addr in net for net in _PRIVATE_NETS):
+                    continue
+                ips_to_resolve.append(ip)
+
+            hostnames = self._resolve_hostnames(ips_to_resolve)
+            for hop in hops:
+                hop["host"] = hostnames.get(hop["ip"], hop["host"])
+
         except Exception as e:
             hops.append({
                 "hop": 1,
@@ -299,59 +438,46 @@ class NetworkDiagnostics:
         Returns:
             dict: Dicionário com resultados do escaneamento contendo IPs e status
         """
-        import ipaddress
-        import concurrent.futures
-        
+        import asyncio
+        import itertools
+
         results = {"active_devices": [], "total_scanned": 0}
-        
+
         try:
-            # Verifica o sistema operacional para determinar o comando ping adequado
-            param = '-n' if platform.system().lower() == 'windows' else '-c'
-            
-            # Função para verificar se um único IP está ativo
-            def check_ip(ip):
-                ip_str = str(ip)
-                # Executa o comando ping com timeout curto
-                command = f"ping {param} 1 -w 1 {ip_str}"
-                response = os.system(command + " > /dev/null 2>&1")
-                
-                # Tenta resolver o nome do host
-                try:
-                    hostname = socket.getfqdn(ip_str)
-                    if hostname == ip_str:
-                        hostname = "N/A"
-                except:
-                    hostname = "N/A"
-                
-                if response == 0:
-                    return {"ip": ip_str, "status": "Ativo", "hostname": hostname}
-                return None
-            
             # Analisa a subrede fornecida
             try:
                 network = ipaddress.ip_network(subnet, strict=False)
-                total_ips = min(254, len(list(network.hosts())))  # Limita a 254 IPs para evitar escaneamentos muito longos
             except ValueError:
                 return {"error": f"Subrede inválida: {subnet}", "active_devices": [], "total_scanned": 0}
-            
-            # Usa ThreadPoolExecutor para verificar múltiplos IPs simultaneamente
-            with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-                hosts = list(network.hosts())[:total_ips]
-                results["total_scanned"] = len(hosts)
-                
-                # Exibe barra de progresso enquanto escaneia
-                with tqdm(total=len(hosts), desc="Escaneando rede", unit="IP") as pbar:
-                    futures = {executor.submit(check_ip, ip): ip for ip in hosts}
-                    for future in concurrent.futures.as_completed(futures):
-                        result = future.result()
-                        if result:
-                            results["active_devices"].append(result)
-                        pbar.update(1)
-            
-            # Ordena por endereço IP
-            results["active_devices"].sort(key=lambda x: [int(part) for part in x["ip"].split('.')])
+
+            # Limita a 254 IPs para evitar escaneamentos muito longos;
+            # islice consome o gerador uma única vez e só materializa os
+            # IPs que serão de fato escaneados
+            hosts = [str(ip) for ip in itertools.islice(network.hosts(), 254)]
+            results["total_scanned"] = len(hosts)
+
+            # Envia ICMP diretamente quando icmplib está disponível; caso
+            # contrário dispara pings assíncronos para sobrepor as esperas
+            if icmp_multiping is not None:
+                try:
+                    results["active_devices"] = self._scan_hosts_icmp(hosts)
+                except Exception:
+                    results["active_devices"] = asyncio.run(self._scan_hosts_async(hosts))
+            else:
+                results["active_devices"] = asyncio.run(self._scan_hosts_async(hosts))
+
+            # Resolve os nomes apenas dos IPs que responderam (tipicamente
+            # poucos em uma /24), todos de uma vez em paralelo
+            hostnames = self._resolve_hostnames([d["ip"] for d in results["active_devices"]])
+            for device in results["active_devices"]:
+                hostname = hostnames.get(device["ip"], device["ip"])
+                device["hostname"] = hostname if hostname != device["ip"] else "N/A"
+
+            # Ordena por endereço IP (um único inteiro de 32 bits por
+            # comparação, em vez de uma lista de octetos por chamada)
+            results["active_devices"].sort(key=lambda x: int(ipaddress.IPv4Address(x["ip"])))
             results["total_active"] = len(results["active_devices"])
-            
+
             return results
         except Exception as e:
             return {
@@ -360,3 +486,177 @@ class NetworkDiagnostics:
                 "total_scanned": 0,
                 "total_active": 0
             }
+
+    def complete_diagnostics(self, host="google.com", packets=50,
+                             subnet="192.168.1.0/24", on_step_done=None):
+        """
+        Executa todos os diagnósticos em paralelo e reúne os resultados.
+
+        Os cinco diagnósticos são independentes e dominados por espera de
+        rede (o teste de velocidade transfere dados enquanto o traceroute
+        e o escaneamento da subrede aguardam suas próprias sondas), então
+        são submetidos juntos e o fluxo completo custa aproximadamente o
+        tempo da etapa mais lenta em vez da soma das cinco.
+
+        Args:
+            host (str): Alvo das etapas de latência, perda de pacotes e rota.
+            packets (int): Número de pacotes da análise de perda.
+            subnet (str): Subrede do escaneamento de rede.
+            on_step_done: Callable opcional invocado com (nome_da_etapa,
+                concluídas, total) conforme cada etapa termina.
+
+        Returns:
+            dict: Resultados por nome de etapa, na ordem de exibição.
+        """
+        import concurrent.futures
+
+        steps = {
+            "Speed Test": self.speed_test,
+            "Latency Check": lambda: self.latency_check(host),
+            "Packet Loss": lambda: self.packet_loss_analysis(host, packets),
+            "Route Tracing": lambda: self.route_tracing(host),
+            "Network Scan": lambda: self.network_scan(subnet),
+        }
+
+        results = {}
+        done = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = {executor.submit(func): name for name, func in steps.items()}
+            for future in concurrent.futures.as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = {"error": str(e)}
+                done += 1
+                if on_step_done is not None:
+                    on_step_done(name, done, len(steps))
+
+        # Preserva a ordem de exibição independentemente da ordem de término
+        return {name: results[name] for name in steps}
+
+    def _resolve_hostnames(self, ips, max_workers=32):
+        """
+        Resolve os nomes (PTR) de uma lista de IPs em paralelo.
+
+        Cada consulta PTR é quase toda espera de rede, então um pool de
+        threads sobrepõe as resoluções em vez de pagá-las em série.
+
+        Args:
+            ips (list): IPs (strings) a resolver
+            max_workers (int): Número máximo de resoluções simultâneas
+
+        Returns:
+            dict: Mapeamento de IP para nome resolvido (o próprio IP quando
+                a resolução falha)
+        """
+        import concurrent.futures
+
+        if not ips:
+            return {}
+
+        def resolve(ip):
+            try:
+                return socket.gethostbyaddr(ip)[0]
+            except Exception:
+                return ip
+
+        # Limita o tempo de cada consulta enquanto o lote roda, restaurando
+        # o timeout global do socket ao final
+        old_timeout = socket.getdefaulttimeout()
+        socket.setdefaulttimeout(1.0)
+        try:
+            workers = min(max_workers, len(ips))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                return dict(zip(ips, executor.map(resolve, ips)))
+        finally:
+            socket.setdefaulttimeout(old_timeout)
+
+    def _scan_hosts_icmp(self, hosts):
+        """
+        Verifica quais IPs respondem usando echo requests ICMP diretos.
+
+        Envia os pacotes em lote com icmplib.multiping, sem criar um
+        processo ping por host. A resolução de nomes fica a cargo do
+        chamador, que a faz em lote apenas para os IPs ativos.
+
+        Args:
+            hosts (list): Lista de IPs (strings) a verificar
+
+        Returns:
+            list: Dicionários com IP, status e hostname dos dispositivos ativos
+        """
+        responses = icmp_multiping(hosts, count=1, timeout=1,
+                                   concurrent_tasks=256, privileged=False)
+
+        active_devices = []
+        for response in responses:
+            if response.is_alive:
+                active_devices.append({"ip": response.address, "status": "Ativo", "hostname": "N/A"})
+
+        return active_devices
+
+    async def _scan_hosts_async(self, hosts, concurrency=128):
+        """
+        Verifica quais IPs respondem ao ping usando subprocessos assíncronos.
+
+        Executa o comando ping diretamente (sem shell intermediário) para cada
+        IP, limitando a quantidade de processos simultâneos com um semáforo.
+        Como o custo de cada verificação é quase todo espera de I/O, o ganho
+        vem de sobrepor centenas de esperas ao mesmo tempo.
+
+        Args:
+            hosts (list): Lista de IPs (strings) a verificar
+            concurrency (int): Número máximo de pings simultâneos
+
+        Returns:
+            list: Dicionários com IP, status e hostname dos dispositivos ativos
+        """
+        import asyncio
+
+        # Determina os parâmetros do comando ping conforme o sistema
+        # operacional; o timeout do -W é em segundos no Linux, mas em
+        # milissegundos no macOS e no -w do Windows
+        if _IS_WINDOWS:
+            ping_args = ['-n', '1', '-w', '1000']
+        elif _OS_NAME == "Darwin":
+            ping_args = ['-c', '1', '-W', '1000']
+        else:
+            ping_args = ['-c', '1', '-W', '1']
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def check_ip(ip_str):
+            # Executa o comando ping com timeout curto, sem shell intermediário.
+            # Qualquer falha de sonda (binário ausente, fork negado) conta
+            # como host inativo: deixá-la propagar derrubaria o asyncio.run
+            # e cada tarefa ainda em voo despejaria um traceback de
+            # "exception was never retrieved" no terminal
+            try:
+                async with semaphore:
+                    proc = await asyncio.create_subprocess_exec(
+                        'ping', *ping_args, ip_str,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
+                    returncode = await proc.wait()
+            except Exception:
+                return None
+
+            if returncode != 0:
+                return None
+
+            return {"ip": ip_str, "status": "Ativo", "hostname": "N/A"}
+
+        active_devices = []
+        tasks = [asyncio.ensure_future(check_ip(ip)) for ip in hosts]
+
+        # Exibe barra de progresso enquanto escaneia
+        with tqdm(total=len(tasks), desc="Escaneando rede", unit="IP") as pbar:
+            for future in asyncio.as_completed(tasks):
+                result = await future
+                if result:
+                    active_devices.append(result)
+                pbar.update(1)
+
+        return active_devices
@@ -12,12 +12,78 @@ import uuid
 import subprocess
 import re
 import os
-import psutil
-import requests
+import asyncio
+import concurrent.futures
 from colorama import Fore, Style
 import platform
 import time
 
+# psutil e requests são importados apenas no primeiro uso: juntos
+# adicionam uma fração perceptível à partida do CLI mesmo para comandos
+# que não consultam contadores de rede nem fazem HTTP
+
+# aiohttp é opcional: quando disponível, as sondagens de IP público
+# rodam no laço de eventos em uma única thread, sobrepondo DNS, TCP,
+# TLS e HTTP de todos os serviços sem o custo de threads para tarefas
+# curtas limitadas por latência
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Sessão HTTP compartilhada com keep-alive, criada sob demanda: amortiza
+# o handshake TCP+TLS entre invocações em vez de criar um pool de
+# conexões novo a cada requests.get
+_SESSION = None
+
+# Timeouts separados de conexão e leitura: um host inalcançável é
+# detectado em 1.5s em vez de consumir o timeout total
+_HTTP_TIMEOUT = (1.5, 3.5)
+
+def _get_session():
+    """
+    Retorna a sessão HTTP compartilhada, criando-a na primeira chamada.
+
+    Sem retries: a corrida entre os serviços de IP já cobre falhas.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=requests.adapters.Retry(total=0, connect=0),
+        ))
+    return _SESSION
+
+# Padrões de extração de servidores DNS, compilados uma única vez no
+# import em vez de a cada chamada de get_dns_servers
+_WIN_DNS_RE = re.compile(r"DNS Servers[^\n]+:[^\n]+((?:\n[^:]+\d+\.\d+\.\d+\.\d+)+)")
+_IPV4_RE = re.compile(r"(\d{1,3}(?:\.\d{1,3}){3})")
+_MAC_DNS_RE = re.compile(r"nameserver\[\d*\]\s*:\s*(\d{1,3}(?:\.\d{1,3}){3})")
+_LINUX_DNS_RE = re.compile(r"nameserver\s+(\d{1,3}(?:\.\d{1,3}){3})")
+
+# Identificação do sistema resolvida uma única vez no import: esses
+# valores não mudam durante a vida do processo, e platform.platform()
+# em particular chama uname(), lê /etc/os-release e formata strings a
+# cada chamada - custo desnecessário por instância de SystemInfo
+_OS_NAME = platform.system()
+_HOSTNAME = socket.gethostname()
+_PLATFORM = platform.platform()
+_PY_VER = platform.python_version()
+
+# Tempo de vida (em segundos) de cada resultado em cache. Esses valores
+# mudam na escala de minutos, então chamadas repetidas pela interface
+# viram consultas a dicionário em vez de sockets/HTTP/subprocessos.
+# None significa sem expiração (o MAC não muda durante a execução)
+_CACHE_TTLS = {
+    "local_ip": 30,
+    "public_ip": 300,
+    "dns_servers": 600,
+    "mac_address": None,
+}
+
 class SystemInfo:
     """
     Classe responsável por coletar e fornecer informações de rede do sistema.
@@ -36,10 +102,41 @@ class SystemInfo:
         Coleta informações básicas sobre o sistema operacional durante
         a inicialização, que serão utilizadas posteriormente em outros métodos.
         """
-        self.os_name = platform.system()  # Nome do sistema operacional
-        self.hostname = socket.gethostname()  # Nome do host
-        self.system_platform = platform.platform()  # Informações da plataforma
-        self.python_version = platform.python_version()  # Versão do Python
+        self.os_name = _OS_NAME  # Nome do sistema operacional
+        self.hostname = _HOSTNAME  # Nome do host
+        self.system_platform = _PLATFORM  # Informações da plataforma
+        self.python_version = _PY_VER  # Versão do Python
+        self._cache = {}  # Resultados memorizados com TTL (ver _CACHE_TTLS)
+        # Amostra de referência dos contadores de rede, coletada na
+        # primeira chamada de get_network_speed (mantém o psutil fora da
+        # partida): as chamadas seguintes calculam a taxa contra ela em
+        # vez de bloquear por 1 segundo
+        self._last_io = None
+        self._last_rates = None
+
+    def _cache_get(self, name):
+        """
+        Retorna o valor em cache para `name`, ou None se ausente/expirado.
+        """
+        entry = self._cache.get(name)
+        if entry is None:
+            return None
+
+        expiry, value = entry
+        if expiry is not None and time.monotonic() > expiry:
+            del self._cache[name]
+            return None
+
+        return value
+
+    def _cache_set(self, name, value):
+        """
+        Armazena `value` em cache com o TTL configurado e o retorna.
+        """
+        ttl = _CACHE_TTLS.get(name)
+        expiry = time.monotonic() + ttl if ttl is not None else None
+        self._cache[name] = (expiry, value)
+        return value
     
     def get_local_ip(self):
         """
@@ -53,27 +150,51 @@ class SystemInfo:
         Returns:
             dict: Dicionário contendo endereços IPv4 e IPv6
         """
+        cached = self._cache_get("local_ip")
+        if cached is not None:
+            return cached
+
         local_ips = {"IPv4": "Não disponível", "IPv6": "Não disponível"}
-        
-        # Tenta obter endereço IPv4
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(('8.8.8.8', 1))  # Servidor DNS do Google
-            local_ips["IPv4"] = s.getsockname()[0]
-            s.close()
-        except Exception as e:
-            local_ips["IPv4"] = f"Não disponível: {str(e)}"
-        
-        # Tenta obter endereço IPv6
+
+        # Sonda IPv4 e IPv6 em paralelo: em hosts sem IPv6, a espera da
+        # sondagem v6 deixa de se somar ao tempo da v4
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            # Servidores DNS do Google como destinos de referência
+            future_v4 = executor.submit(self._probe_local_ip, socket.AF_INET, '8.8.8.8')
+            future_v6 = executor.submit(self._probe_local_ip, socket.AF_INET6, '2001:4860:4860::8888')
+
+            try:
+                local_ips["IPv4"] = future_v4.result(timeout=2)
+            except Exception as e:
+                local_ips["IPv4"] = f"Não disponível: {str(e)}"
+
+            try:
+                local_ips["IPv6"] = future_v6.result(timeout=2)
+            except Exception:
+                local_ips["IPv6"] = "Não disponível"
+
+        return self._cache_set("local_ip", local_ips)
+
+    def _probe_local_ip(self, family, target):
+        """
+        Descobre o endereço local usado para alcançar `target`.
+
+        O "connect" UDP não envia pacote algum: apenas faz o kernel
+        escolher a rota e o endereço de saída, lido com getsockname().
+
+        Args:
+            family: Família do socket (AF_INET ou AF_INET6)
+            target (str): Endereço de referência para a escolha da rota
+
+        Returns:
+            str: Endereço IP local de saída
+        """
+        s = socket.socket(family, socket.SOCK_DGRAM)
         try:
-            s = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
-            s.connect(('2001:4860:4860::8888', 1))  # DNS IPv6 do Google
-            local_ips["IPv6"] = s.getsockname()[0]
+            s.connect((target, 1))
+            return s.getsockname()[0]
+        finally:
             s.close()
-        except Exception as e:
-            local_ips["IPv6"] = "Não disponível"
-            
-        return local_ips
     
     def get_public_ip(self):
         """
@@ -86,27 +207,86 @@ class SystemInfo:
         Returns:
             str: Endereço IP público ou mensagem de erro
         """
+        cached = self._cache_get("public_ip")
+        if cached is not None:
+            return cached
+
         # Lista de serviços para verificar IP público com fallback
         ip_services = [
-            ('https://api.ipify.org', 5),
-            ('https://ipinfo.io/ip', 5),
-            ('https://checkip.amazonaws.com', 5),
-            ('https://ifconfig.me', 5)
+            'https://api64.ipify.org',
+            'https://ipinfo.io/ip',
+            'https://checkip.amazonaws.com',
+            'https://ifconfig.me'
         ]
-        
+
+        # Caminho preferido: sondagem assíncrona com aiohttp
+        if aiohttp is not None:
+            try:
+                ip = asyncio.run(self._get_public_ip_async(ip_services))
+                if ip:
+                    return self._cache_set("public_ip", ip)
+                return "Não foi possível determinar o IP público"
+            except Exception:
+                pass  # Recorre à versão com threads abaixo
+
         try:
-            for service_url, timeout in ip_services:
-                try:
-                    response = requests.get(service_url, timeout=timeout)
+            # Consulta todos os serviços em paralelo e usa a primeira
+            # resposta válida: um serviço lento ou fora do ar deixa de
+            # bloquear os demais por até 5 segundos cada
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(ip_services))
+            try:
+                session = _get_session()
+                futures = {executor.submit(session.get, url, timeout=_HTTP_TIMEOUT): url
+                           for url in ip_services}
+
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        response = future.result()
+                    except Exception:
+                        continue
                     if response.status_code == 200:
-                        return response.text.strip()
-                except:
-                    continue
-                    
-            return "Não foi possível determinar o IP público"
+                        # Só respostas válidas entram no cache
+                        return self._cache_set("public_ip", response.text.strip())
+
+                return "Não foi possível determinar o IP público"
+            finally:
+                # Cancela as consultas restantes sem esperar por elas
+                executor.shutdown(wait=False, cancel_futures=True)
         except Exception as e:
             return f"Erro ao obter o IP público: {str(e)}"
-    
+
+    async def _get_public_ip_async(self, ip_services):
+        """
+        Consulta os serviços de IP público de forma assíncrona.
+
+        Dispara uma requisição para cada serviço e retorna o corpo da
+        primeira resposta bem-sucedida, cancelando as demais. Com aiodns
+        instalado, o aiohttp resolve nomes sem bloquear o laço de eventos.
+
+        Args:
+            ip_services (list): URLs dos serviços de verificação de IP
+
+        Returns:
+            str: Endereço IP público, ou None se nenhum serviço respondeu
+        """
+        timeout = aiohttp.ClientTimeout(total=5)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            tasks = [asyncio.create_task(session.get(url)) for url in ip_services]
+            try:
+                for done in asyncio.as_completed(tasks):
+                    try:
+                        response = await done
+                    except Exception:
+                        continue
+                    if response.status == 200:
+                        return (await response.text()).strip()
+            finally:
+                # Cancela as consultas ainda pendentes
+                for task in tasks:
+                    task.cancel()
+
+        return None
+
     def get_mac_address(self):
         """
         Obtém o endereço MAC da interface principal de rede.
@@ -118,14 +298,19 @@ class SystemInfo:
         Returns:
             str: Endereço MAC formatado
         """
-        # Obtem o número MAC como inteiro
-        mac = uuid.getnode()
-        
-        # Converte para o formato XX:XX:XX:XX:XX:XX
-        mac_formatted = ':'.join(['{:02x}'.format((mac >> elements) & 0xff) 
-                                  for elements in range(0, 8 * 6, 8)][::-1])
-        
-        return mac_formatted
+        cached = self._cache_get("mac_address")
+        if cached is not None:
+            return cached
+
+        # Obtem o número MAC como inteiro (máscara de 48 bits, pois
+        # uuid.getnode() pode trazer bits extras acima do endereço)
+        mac = uuid.getnode() & 0xFFFFFFFFFFFF
+
+        # Converte para o formato XX:XX:XX:XX:XX:XX em uma única chamada
+        # em C, sem formatar e inverter byte a byte em Python
+        mac_formatted = mac.to_bytes(6, 'big').hex(':')
+
+        return self._cache_set("mac_address", mac_formatted)
     
     def get_network_interfaces(self):
         """
@@ -138,45 +323,64 @@ class SystemInfo:
         Returns:
             list: Lista de strings com informações formatadas das interfaces
         """
+        import psutil  # Importação adiada; sys.modules memoriza as seguintes
+
         interfaces = []
-        
+
         # Coleta informações sobre interfaces de rede usando psutil
         net_if_addrs = psutil.net_if_addrs()
         net_if_stats = psutil.net_if_stats()
-        
+
+        # Constantes de família resolvidas uma única vez antes do laço
+        af_inet = socket.AF_INET
+        af_inet6 = socket.AF_INET6
+        af_link = psutil.AF_LINK
+
         # Itera sobre todas as interfaces encontradas
         for interface_name, interface_addresses in net_if_addrs.items():
-            # Ignora interfaces de loopback
-            if interface_name.startswith('lo'):
+            # Ignora interfaces de loopback, identificadas pelos endereços
+            # (127.0.0.0/8 ou ::1) e não pelo prefixo do nome - que falha
+            # com "Loopback Pseudo-Interface 1" no Windows e descartaria
+            # interfaces legítimas como "lom0"
+            is_loopback = any(
+                (addr.family == af_inet and addr.address.startswith('127.'))
+                or (addr.family == af_inet6 and addr.address.split('%')[0] == '::1')
+                for addr in interface_addresses
+            )
+            if is_loopback:
                 continue
-            
-            # Verifica se a interface está ativa
-            status = "Ativo" if net_if_stats.get(interface_name) and getattr(net_if_stats.get(interface_name), 'isup', False) else "Inativo"
-            
-            addresses = []
+
+            # Verifica se a interface está ativa (uma única consulta de status)
+            stat = net_if_stats.get(interface_name)
+            status = "Ativo" if stat is not None and stat.isup else "Inativo"
+
+            addresses_v4 = []
+            addresses_v6 = []
             mac_address = None
-            
+
             # Processa todos os endereços associados a esta interface
             for addr in interface_addresses:
-                if addr.family == socket.AF_INET:
+                if addr.family == af_inet:
                     # Endereço IPv4
-                    addresses.append(f"IPv4: {addr.address}")
-                elif addr.family == socket.AF_INET6:
+                    addresses_v4.append(f"IPv4: {addr.address}")
+                elif addr.family == af_inet6:
                     # Endereço IPv6 (ignora endereços link-local)
                     if not addr.address.startswith('fe80'):
-                        addresses.append(f"IPv6: {addr.address}")
-                elif addr.family == psutil.AF_LINK:
+                        addresses_v6.append(f"IPv6: {addr.address}")
+                elif addr.family == af_link:
                     # Endereço MAC da interface
                     mac_address = addr.address
-            
-            # Formata as informações da interface
-            interface_info = f"{interface_name} - {status}"
+
+            # Formata as informações da interface com um único join, em
+            # vez de concatenações sucessivas que realocam a string
+            parts = [interface_name, status]
             if mac_address:
-                interface_info += f" - MAC: {mac_address}"
+                parts.append(f"MAC: {mac_address}")
+            addresses = addresses_v4 + addresses_v6
             if addresses:
-                interface_info += f" - {', '.join(addresses)}"
-            
-            interfaces.append(interface_info)
+                parts.append(', '.join(addresses))
+
+            interfaces.append(" - ".join(parts))
         
         # Caso não encontre nenhuma interface válida
         if not interfaces:
@@ -187,38 +391,60 @@ class SystemInfo:
     def get_network_speed(self):
         """
         Mede a velocidade atual de download e upload da rede.
-        
-        Este método monitora as interfaces de rede por um segundo,
-        calculando a taxa de transferência com base na diferença entre
-        os contadores de bytes enviados e recebidos. O resultado é
-        convertido para Megabits por segundo (Mbps).
-        
+
+        Em vez de bloquear por um segundo a cada chamada, o método calcula
+        a taxa com base na diferença entre os contadores atuais e a amostra
+        guardada na chamada anterior (coletada na primeira chamada). Apenas na
+        partida a frio, quando a janela ainda é curta demais para uma
+        medição estável, há uma breve espera. O resultado é convertido
+        para Megabits por segundo (Mbps).
+
         Returns:
             dict: Velocidades medidas (download, upload) e totais acumulados
         """
         try:
-            # Coleta estatísticas iniciais
-            start_stats = psutil.net_io_counters()
-            # Aguarda 1 segundo para medição
-            time.sleep(1)
-            # Coleta estatísticas finais
+            import psutil  # Importação adiada
+
+            now = time.monotonic()
+            if self._last_io is None:
+                # Primeira chamada: coleta a amostra de referência
+                self._last_io = (psutil.net_io_counters(), now)
+
+            start_stats, last_time = self._last_io
+            dt = now - last_time
+
+            if dt < 0.25:
+                # Chamadas em sequência reaproveitam a última medição
+                if self._last_rates is not None:
+                    return self._last_rates
+
+                # Partida a frio: espera apenas o suficiente para uma
+                # janela mínima de medição
+                time.sleep(0.25 - dt)
+                now = time.monotonic()
+                dt = now - last_time
+
+            # Coleta estatísticas atuais
             end_stats = psutil.net_io_counters()
-            
-            # Calcula a diferença de bytes em 1 segundo e converte para Mbps
+
+            # Calcula a taxa na janela decorrida e converte para Mbps
             # (bytes * 8 bits/byte) / (1_000_000 bits/Mbps)
-            download = (end_stats.bytes_recv - start_stats.bytes_recv) * 8 / 1_000_000
-            upload = (end_stats.bytes_sent - start_stats.bytes_sent) * 8 / 1_000_000
-            
+            download = (end_stats.bytes_recv - start_stats.bytes_recv) * 8 / 1_000_000 / dt
+            upload = (end_stats.bytes_sent - start_stats.bytes_sent) * 8 / 1_000_000 / dt
+
             # Estatísticas totais de dados enviados/recebidos (em MB)
             total_sent = end_stats.bytes_sent / (1024 * 1024)
             total_recv = end_stats.bytes_recv / (1024 * 1024)
-            
-            return {
+
+            # Guarda a amostra atual como referência da próxima chamada
+            self._last_io = (end_stats, now)
+            self._last_rates = {
                 "download": f"{download:.2f}",  # Velocidade de download em Mbps
                 "upload": f"{upload:.2f}",      # Velocidade de upload em Mbps
                 "total_sent": f"{total_sent:.2f}",  # Total enviado em MB
                 "total_recv": f"{total_recv:.2f}"   # Total recebido em MB
             }
+            return self._last_rates
         except Exception as e:
             return {
                 "download": "0.00",
@@ -238,39 +464,53 @@ class SystemInfo:
         Returns:
             list: Lista de servidores DNS encontrados
         """
+        cached = self._cache_get("dns_servers")
+        if cached is not None:
+            return cached
+
+        # dnspython lê a configuração do resolvedor diretamente (registro
+        # no Windows, resolv.conf no Unix), sem criar um processo
+        # ipconfig/scutil nem decodificar sua saída
+        try:
+            import dns.resolver
+            nameservers = dns.resolver.Resolver().nameservers
+            if nameservers:
+                return self._cache_set("dns_servers", [str(server) for server in nameservers])
+        except Exception:
+            pass  # Recorre à detecção por sistema operacional abaixo
+
         dns_servers = []
-        
+
         try:
             # Detecção específica por sistema operacional
             if self.os_name == "Windows":
                 # Extrai servidores DNS do output do ipconfig no Windows
                 output = subprocess.check_output("ipconfig /all", shell=True).decode()
-                dns_pattern = r"DNS Servers[^\n]+:[^\n]+((?:\n[^:]+[0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)+)"
-                dns_matches = re.findall(dns_pattern, output)
-                
+                dns_matches = _WIN_DNS_RE.findall(output)
+
                 for match in dns_matches:
-                    servers = re.findall(r"([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)", match)
+                    servers = _IPV4_RE.findall(match)
                     dns_servers.extend(servers)
-                    
+
             elif self.os_name == "Darwin":
                 # Extrai servidores DNS no macOS (Darwin)
                 output = subprocess.check_output("scutil --dns", shell=True).decode()
-                dns_servers = re.findall(r"nameserver\[0-9]*\s*:\s*([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)", output)
-                
+                dns_servers = _MAC_DNS_RE.findall(output)
+
             else:
                 # Para Linux e outros sistemas, lê o arquivo resolv.conf
                 if os.path.exists("/etc/resolv.conf"):
                     with open("/etc/resolv.conf", "r") as f:
                         resolv_conf = f.read()
-                    dns_servers = re.findall(r"nameserver\s+([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)", resolv_conf)
+                    dns_servers = _LINUX_DNS_RE.findall(resolv_conf)
         except Exception as e:
             dns_servers = []
             
         # Se nenhum servidor DNS for encontrado, fornece opções de DNS públicos
         if not dns_servers:
             dns_servers = ["8.8.8.8 (Google DNS)", "1.1.1.1 (Cloudflare DNS)", "208.67.222.222 (OpenDNS)"]
-            
-        return dns_servers
+
+        return self._cache_set("dns_servers", dns_servers)
         
     def get_system_info(self):
         """
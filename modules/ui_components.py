@@ -12,11 +12,68 @@ terminais de linha de comando, com suporte a cores e elementos visuais.
 import os
 import sys
 import time
-import pyfiglet
+import re
+import functools
 from colorama import Fore, Style, Back
 import random
 import platform
-from tqdm import tqdm
+
+# wcwidth é opcional: mede a largura real de caracteres largos (CJK,
+# emoji) nas colunas do terminal; sem ele, usamos len() do texto limpo
+try:
+    import wcwidth
+except ImportError:
+    wcwidth = None
+
+# Sequências ANSI de cor (ESC[...m), removidas antes de medir larguras
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+def clear_screen():
+    """
+    Limpa a tela escrevendo as sequências ANSI diretamente.
+
+    os.system('cls'/'clear') paga um fork+exec (5-20ms) a cada redesenho
+    de menu; a escrita de "limpar e ir para a origem" faz o mesmo sem
+    processo algum. No Windows 10+ o modo VT já está habilitado via
+    colorama na partida.
+    """
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
+
+@functools.lru_cache(maxsize=1024)
+def _visible_len(s):
+    """
+    Largura visível de `s` em colunas do terminal.
+
+    Ignora códigos ANSI de cor e, com wcwidth instalado, conta
+    caracteres de largura dupla corretamente. Memorizada: em menus e
+    tabelas redesenhados, chaves repetidas viram consulta ao cache.
+    """
+    stripped = _ANSI_RE.sub('', s)
+    if wcwidth is not None:
+        width = wcwidth.wcswidth(stripped)
+        if width >= 0:
+            return width
+    return len(stripped)
+
+# pyfiglet (que indexa seu diretório de fontes no import) e tqdm são
+# importados apenas no primeiro uso: juntos custam dezenas de
+# milissegundos na partida do CLI mesmo quando o comando não os usa
+
+# Fonte sorteada uma única vez por processo: evita que o banner "pisque"
+# entre estilos a cada redesenho e mantém o cache de renderização útil
+_FONT = random.choice(["standard", "slant", "smslant"])
+
+@functools.lru_cache(maxsize=32)
+def _render_banner(text, font):
+    """
+    Renderiza (e memoriza) a arte ASCII de um banner.
+
+    O carregamento da fonte e o layout do pyfiglet custam alguns
+    milissegundos; banners repetidos viram uma consulta ao cache.
+    """
+    import pyfiglet  # Importação adiada; sys.modules memoriza as seguintes
+    return pyfiglet.figlet_format(text, font=font)
 
 def display_banner(text):
     """
@@ -28,18 +85,14 @@ def display_banner(text):
     Args:
         text (str): O texto a ser mostrado no banner.
     """
-    # Limpa a tela com comando apropriado de acordo com o sistema operacional
-    os.system('cls' if os.name == 'nt' else 'clear')
-    
-    # Fontes para estilo mais sóbrio
-    font_options = ["standard", "slant", "smslant"]
-    selected_font = random.choice(font_options)
+    # Limpa a tela sem criar um processo para isso
+    clear_screen()
     
     # Usar cores minimalistas para o banner
     banner_color = Fore.WHITE + Style.BRIGHT
-    
-    # Use pyfiglet to create ASCII art
-    banner = pyfiglet.figlet_format(text, font=selected_font)
+
+    # Usa a arte ASCII memorizada (fonte fixa por processo)
+    banner = _render_banner(text, _FONT)
     
     # Criar decoração estilizada minimalista
     border_length = 70
@@ -72,22 +125,27 @@ def display_menu(prompt, options):
     menu_width = 60
     box_color = Fore.WHITE + Style.DIM
     title_color = Fore.WHITE + Style.BRIGHT
-    
+
+    # Monta o quadro inteiro em memória para fazer uma única escrita no
+    # stdout, em vez de um print (e um flush) por linha
+    lines = []
+
     # Título do menu com caixa
-    print("\n" + box_color + "┌" + "─" * menu_width + "┐" + Style.RESET_ALL)
+    lines.append("\n" + box_color + "┌" + "─" * menu_width + "┐" + Style.RESET_ALL)
     title_line = f"{title_color}{prompt}{Style.RESET_ALL}"
-    padding = (menu_width - len(prompt)) // 2
-    print(box_color + "│" + " " * padding + title_line + " " * (menu_width - padding - len(prompt)) + "│" + Style.RESET_ALL)
-    print(box_color + "├" + "─" * menu_width + "┤" + Style.RESET_ALL)
-    
+    prompt_len = _visible_len(prompt)
+    padding = (menu_width - prompt_len) // 2
+    lines.append(box_color + "│" + " " * padding + title_line + " " * (menu_width - padding - prompt_len) + "│" + Style.RESET_ALL)
+    lines.append(box_color + "├" + "─" * menu_width + "┤" + Style.RESET_ALL)
+
     # Opções do menu
     for option in options:
         option_text = option
-        
+
         # Se a opção começa com um número (ex: "1. Option"), extraímos o número
         if option_text[0].isdigit() and '. ' in option_text:
             num, text = option_text.split('. ', 1)
-            
+
             # Para um tema preto/escuro, simples, sem emojis
             if num == "0":
                 # Opção Exit com cor vermelha
@@ -95,17 +153,20 @@ def display_menu(prompt, options):
             else:
                 # Outras opções em branco
                 colored_option = num + ". " + Fore.WHITE + text + Style.RESET_ALL
-                
-            print(box_color + "│ " + Style.RESET_ALL + colored_option + 
-                  " " * (menu_width - len(text) - len(num) - 2) + box_color + "│" + Style.RESET_ALL)
+
+            lines.append(box_color + "│ " + Style.RESET_ALL + colored_option +
+                  " " * (menu_width - _visible_len(text) - len(num) - 2) + box_color + "│" + Style.RESET_ALL)
         else:
             # Opção sem número
-            print(box_color + "│ " + Style.RESET_ALL + option_text + 
-                  " " * (menu_width - len(option_text) - 1) + box_color + "│" + Style.RESET_ALL)
-    
+            lines.append(box_color + "│ " + Style.RESET_ALL + option_text +
+                  " " * (menu_width - _visible_len(option_text) - 1) + box_color + "│" + Style.RESET_ALL)
+
     # Rodapé da caixa
-    print(box_color + "└" + "─" * menu_width + "┘" + Style.RESET_ALL)
-    
+    lines.append(box_color + "└" + "─" * menu_width + "┘" + Style.RESET_ALL)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
     # Input minimalista
     try:
         input_prompt = Fore.WHITE + Style.DIM + "> " + Style.RESET_ALL
@@ -123,6 +184,8 @@ def display_loading(duration=2):
     Args:
         duration (int): Duration of the animation in seconds.
     """
+    from tqdm import tqdm  # Importação adiada para acelerar a partida
+
     # Animações mais minimalistas, adequadas para tema escuro
     animations = [
         "█▁▁▁▁",
@@ -155,14 +218,29 @@ def display_loading(duration=2):
     # Define barra de progresso minimalista em preto e branco
     bar_format = "{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}"
     
-    # Exibe a barra de progresso com tema minimalista
-    for _ in tqdm(range(0, 100), 
-                 desc=f"{Fore.WHITE + Style.DIM}{loading_message}{Style.RESET_ALL}", 
-                 bar_format=bar_format, 
-                 ncols=80, 
-                 leave=False,
-                 colour='white'):
-        time.sleep(duration / 100)
+    # Exibe a barra de progresso com tema minimalista. O avanço é derivado
+    # do relógio monotônico e redesenhado a cada 50ms, em vez de 100 sleeps
+    # curtos com um redesenho cada: menos idas ao escalonador e duração
+    # total exata
+    with tqdm(total=100,
+              desc=f"{Fore.WHITE + Style.DIM}{loading_message}{Style.RESET_ALL}",
+              bar_format=bar_format,
+              ncols=80,
+              leave=False,
+              colour='white') as bar:
+        start = time.monotonic()
+        end = start + duration
+
+        while True:
+            now = time.monotonic()
+            if now >= end:
+                break
+            bar.n = int(100 * (now - start) / duration)
+            bar.refresh()
+            time.sleep(min(0.05, end - now))
+
+        bar.n = 100
+        bar.refresh()
     
     # Exibe mensagem de conclusão simples
     print(f"\n{Fore.WHITE + Style.DIM}Concluído.{Style.RESET_ALL}")
@@ -234,80 +312,108 @@ def confirm_action(prompt):
         print(Fore.WHITE + Style.DIM + "Executando em modo não-interativo. Usando 'sim' por padrão." + Style.RESET_ALL)
         return True
 
+# Unidades para medições comuns, definidas uma única vez no módulo
+_UNITS = {
+    'download': 'Mbps',
+    'upload': 'Mbps',
+    'ping': 'ms',
+    'min': 'ms',
+    'avg': 'ms',
+    'max': 'ms',
+    'loss': '%',
+    'time': 'ms',
+    'packets_sent': '',
+    'packets_received': '',
+    'packet_loss': '%',
+    'jitter': 'ms'
+}
+
+@functools.lru_cache(maxsize=64)
+def _table_row_specs(keys, include_units):
+    """
+    Pré-computa, por conjunto de chaves, os dados fixos de cada linha.
+
+    Resultados de formato estável (como o de velocidade de rede, sempre
+    com as mesmas 4 chaves) reaparecem a cada redesenho; a chave de
+    exibição e o sufixo de unidade de cada linha são derivados uma única
+    vez e reutilizados das chamadas seguintes.
+
+    Args:
+        keys (tuple): Chaves do dicionário de dados, na ordem de exibição.
+        include_units (bool): Se sufixos de unidade devem ser anexados.
+
+    Returns:
+        tuple: Triplas (chave, chave de exibição, sufixo de unidade).
+    """
+    specs = []
+    for key in keys:
+        unit = _UNITS.get(key.lower(), '') if include_units else ''
+        display_key = key.replace('_', ' ').capitalize()
+        specs.append((key, display_key, f" {unit}" if unit else ''))
+    return tuple(specs)
+
 def display_result_table(title, data, include_units=False):
     """
     Displays a result table with a minimalist, dark format.
-    
+
     Args:
         title (str): The title of the result table.
         data (dict): Dictionary with results to display.
         include_units (bool): Whether to include units when displaying values.
     """
-    # Definir unidades para medições comuns
-    units = {
-        'download': 'Mbps',
-        'upload': 'Mbps',
-        'ping': 'ms',
-        'min': 'ms',
-        'avg': 'ms',
-        'max': 'ms',
-        'loss': '%',
-        'time': 'ms',
-        'packets_sent': '',
-        'packets_received': '',
-        'packet_loss': '%',
-        'jitter': 'ms'
-    }
-    
-    # Calcular largura da tabela
-    max_key_len = max([len(str(k)) for k in data.keys()]) if data else 10
-    max_val_len = max([len(str(v)) + 5 for v in data.values()]) if data else 10
+    # Calcular largura da tabela (largura visível, sem códigos ANSI)
+    max_key_len = max([_visible_len(str(k)) for k in data.keys()]) if data else 10
+    max_val_len = max([_visible_len(str(v)) + 5 for v in data.values()]) if data else 10
     table_width = max_key_len + max_val_len + 8
     
     # Estilo minimalista em preto/branco
     border_color = Fore.WHITE + Style.DIM
     header_color = Fore.WHITE + Style.BRIGHT
-    
+
+    # Monta a tabela inteira em memória e escreve uma única vez
+    lines = ["\n"]
+
     # Título com estilo minimalista
-    print("\n")
-    print(border_color + "┌" + "─" * table_width + "┐" + Style.RESET_ALL)
-    
+    lines.append(border_color + "┌" + "─" * table_width + "┐" + Style.RESET_ALL)
+
     # Centralizar título
-    title_padding = (table_width - len(title)) // 2
-    print(border_color + "│" + " " * title_padding + 
-          header_color + title + 
-          Style.RESET_ALL + border_color + " " * (table_width - title_padding - len(title)) + "│" + Style.RESET_ALL)
-    
-    print(border_color + "├" + "─" * table_width + "┤" + Style.RESET_ALL)
-    
-    # Exibir dados da tabela com estilo minimalista
-    for key, value in data.items():
-        # Formatar valor
+    title_len = _visible_len(title)
+    title_padding = (table_width - title_len) // 2
+    lines.append(border_color + "│" + " " * title_padding +
+          header_color + title +
+          Style.RESET_ALL + border_color + " " * (table_width - title_padding - title_len) + "│" + Style.RESET_ALL)
+
+    lines.append(border_color + "├" + "─" * table_width + "┤" + Style.RESET_ALL)
+
+    # Modelo de linha pré-computado: prefixos de cor e larguras são
+    # resolvidos uma única vez e cada linha vira um único format(),
+    # sem concatenações nem preenchimentos manuais por iteração
+    row_template = (border_color + "│ " + Style.RESET_ALL +
+                    Fore.WHITE + "{key:<" + str(max_key_len + 2) + "}" +
+                    Fore.WHITE + Style.BRIGHT + "{value:<" + str(max_val_len) + "}" +
+                    border_color + " │" + Style.RESET_ALL)
+
+    # Exibir dados da tabela com estilo minimalista. As partes fixas de
+    # cada linha (chave de exibição e sufixo de unidade) vêm do cache
+    # por conjunto de chaves; só o valor é formatado por chamada
+    for key, display_key, unit_suffix in _table_row_specs(tuple(data), include_units):
+        value = data[key]
+
+        # Formatar valor (com sufixo de unidade já resolvido)
         if isinstance(value, float):
-            formatted_value = f"{value:.2f}"
+            formatted_value = f"{value:.2f}{unit_suffix}"
         else:
-            formatted_value = str(value)
-            
-        # Adicionar unidade se necessário
-        if include_units and key.lower() in units:
-            unit = units[key.lower()]
-            if unit:  # Só adiciona se houver unidade
-                formatted_value = f"{formatted_value} {unit}"
-        
-        # Formatar chave para exibição (substituir underscore por espaço e capitalize)
-        display_key = key.replace('_', ' ').capitalize()
-        
-        # Imprimir linha da tabela com estilo minimalista
-        print(border_color + "│ " + Style.RESET_ALL + 
-              Fore.WHITE + display_key + 
-              " " * (max_key_len - len(display_key) + 2) + 
-              Fore.WHITE + Style.BRIGHT + formatted_value + 
-              " " * (max_val_len - len(formatted_value)) + 
-              border_color + " │" + Style.RESET_ALL)
-    
+            formatted_value = f"{value}{unit_suffix}"
+
+        # Linha da tabela com estilo minimalista
+        lines.append(row_template.format(key=display_key, value=formatted_value))
+
     # Rodapé da tabela
-    print(border_color + "└" + "─" * table_width + "┘" + Style.RESET_ALL)
-    print()
+    lines.append(border_color + "└" + "─" * table_width + "┘" + Style.RESET_ALL)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 def display_multi_result(title, data_list):
     """
@@ -322,55 +428,61 @@ def display_multi_result(title, data_list):
     border_color = Fore.WHITE + Style.DIM
     title_color = Fore.WHITE + Style.BRIGHT
     
+    # Monta o relatório inteiro em memória e escreve uma única vez
+    lines = ["\n"]
+
     # Título principal
-    print("\n")
-    print(border_color + "┌" + "─" * border_width + "┐" + Style.RESET_ALL)
-    
+    lines.append(border_color + "┌" + "─" * border_width + "┐" + Style.RESET_ALL)
+
     # Centralizar título principal
-    title_padding = (border_width - len(title)) // 2
-    print(border_color + "│" + " " * title_padding + 
-          title_color + title + 
-          Style.RESET_ALL + border_color + " " * (border_width - title_padding - len(title)) + "│" + Style.RESET_ALL)
-    
-    print(border_color + "├" + "─" * border_width + "┤" + Style.RESET_ALL)
-    
+    title_len = _visible_len(title)
+    title_padding = (border_width - title_len) // 2
+    lines.append(border_color + "│" + " " * title_padding +
+          title_color + title +
+          Style.RESET_ALL + border_color + " " * (border_width - title_padding - title_len) + "│" + Style.RESET_ALL)
+
+    lines.append(border_color + "├" + "─" * border_width + "┤" + Style.RESET_ALL)
+
     # Para cada conjunto de dados, criar uma seção
     for i, section in enumerate(data_list):
         section_title = section.get('title', f"Seção {i+1}")
         section_data = section.get('data', {})
-        
-        # Exibir título da seção
+
+        # Título da seção
         section_color = Fore.WHITE
-        print(border_color + "│ " + Style.RESET_ALL + 
-              section_color + Style.BRIGHT + section_title + 
-              Style.RESET_ALL + border_color + " " * (border_width - len(section_title) - 2) + "│" + Style.RESET_ALL)
-        
+        lines.append(border_color + "│ " + Style.RESET_ALL +
+              section_color + Style.BRIGHT + section_title +
+              Style.RESET_ALL + border_color + " " * (border_width - _visible_len(section_title) - 2) + "│" + Style.RESET_ALL)
+
         # Linha divisória entre o título da seção e os dados
-        print(border_color + "│ " + "─" * (border_width - 4) + 
+        lines.append(border_color + "│ " + "─" * (border_width - 4) +
               border_color + " │" + Style.RESET_ALL)
-        
-        # Exibir dados da seção
+
+        # Dados da seção
         for key, value in section_data.items():
             # Formatar valor
             if isinstance(value, float):
                 formatted_value = f"{value:.2f}"
             else:
                 formatted_value = str(value)
-                
+
             # Formatar chave para exibição
             display_key = key.replace('_', ' ').capitalize()
-            
-            # Imprimir linha de dados
-            print(border_color + "│ " + Style.RESET_ALL + 
-                  Fore.WHITE + Style.DIM + "  " + display_key + ": " + 
-                  Style.RESET_ALL + Fore.WHITE + formatted_value + 
-                  " " * (border_width - len(display_key) - len(formatted_value) - 4) + 
+
+            # Linha de dados
+            lines.append(border_color + "│ " + Style.RESET_ALL +
+                  Fore.WHITE + Style.DIM + "  " + display_key + ": " +
+                  Style.RESET_ALL + Fore.WHITE + formatted_value +
+                  " " * (border_width - _visible_len(display_key) - _visible_len(formatted_value) - 4) +
                   border_color + "│" + Style.RESET_ALL)
-        
+
         # Se não for a última seção, adicionar divisor entre seções
         if i < len(data_list) - 1:
-            print(border_color + "│" + " " * border_width + "│" + Style.RESET_ALL)
-    
+            lines.append(border_color + "│" + " " * border_width + "│" + Style.RESET_ALL)
+
     # Rodapé
-    print(border_color + "└" + "─" * border_width + "┘" + Style.RESET_ALL)
-    print()
+    lines.append(border_color + "└" + "─" * border_width + "┘" + Style.RESET_ALL)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
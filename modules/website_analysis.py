@@ -10,24 +10,178 @@ suportando análises de segurança e desempenho.
 """
 
 import socket
-import dns.resolver
 import subprocess
 import re
-import whois
+import select
+import selectors
+import errno
+import struct
+import os
 import ssl
-import OpenSSL
+import asyncio
 import concurrent.futures
+import threading
 from datetime import datetime
 import platform
-import json
 import time
-import traceback
+
+# Per-reply RTT pattern for the subprocess ping fallback, compiled once
+# at import time; matches "time=12.3 ms" (Unix) and "time=12ms"/"time<1ms"
+# (Windows) reply lines
+_RE_PING_RTT = re.compile(r"time[=<]([\d.]+)\s*ms")
+
+# uvloop is optional: when installed it becomes the asyncio event-loop
+# policy, giving the async scanner 2-4x loop throughput on Linux
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# cryptography is optional: its Rust-backed X.509 parser decodes the DER
+# certificate directly, skipping the nested Python tuple representation
+# that getpeercert() builds and the string re-joining it forces on us
+try:
+    from cryptography import x509 as _x509
+except ImportError:
+    _x509 = None
+
+# One SSL context for the whole process: create_default_context loads
+# and parses the entire system CA bundle (hundreds of PEM certs) each
+# time, tens of milliseconds that were paid on every get_ssl_info call
+_SSL_CTX = ssl.create_default_context()
+
+# Non-blocking connect_ex results that mean "still connecting"
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK}
+if hasattr(errno, "WSAEWOULDBLOCK"):
+    _CONNECT_IN_PROGRESS.add(errno.WSAEWOULDBLOCK)
+
+# Process-wide DNS cache keyed on (domain, record type / family): the
+# complete-analysis flow resolves the same name 4+ times, and each of
+# those resolutions is a full network round-trip without this
+_DNS_CACHE = {}
+_DNS_CACHE_LOCK = threading.Lock()
+_DNS_CACHE_TTL = 60  # seconds
+# WHOIS answers and certificates change on the scale of months; an hour
+# covers a whole interactive session without going stale in practice
+_RESULT_CACHE_TTL = 3600  # seconds
+
+def _cached_lookup(key, lookup, ttl=_DNS_CACHE_TTL):
+    """
+    Return the cached value for `key`, resolving it at most once.
+
+    Concurrent callers for the same key coalesce behind a single
+    in-flight lookup (an Event placeholder in the cache) instead of each
+    issuing a duplicate query. Failures are not cached.
+
+    Args:
+        key: Hashable cache key.
+        lookup: Zero-argument callable performing the real resolution.
+        ttl (int): Seconds the result stays valid.
+
+    Returns:
+        The lookup result, fresh or cached.
+    """
+    with _DNS_CACHE_LOCK:
+        entry = _DNS_CACHE.get(key)
+        if isinstance(entry, tuple) and time.monotonic() < entry[0]:
+            return entry[1]
+        event = entry if isinstance(entry, threading.Event) else None
+        if event is None:
+            # We own the miss: leave a placeholder for concurrent callers
+            _DNS_CACHE[key] = threading.Event()
+
+    if event is not None:
+        # Another thread is already resolving this key; wait for it
+        event.wait(10)
+        with _DNS_CACHE_LOCK:
+            entry = _DNS_CACHE.get(key)
+        if isinstance(entry, tuple):
+            return entry[1]
+        # The in-flight lookup failed or timed out; do our own below
+
+    try:
+        value = lookup()
+    except Exception:
+        with _DNS_CACHE_LOCK:
+            entry = _DNS_CACHE.pop(key, None)
+        if isinstance(entry, threading.Event):
+            entry.set()
+        raise
+
+    with _DNS_CACHE_LOCK:
+        entry = _DNS_CACHE.get(key)
+        _DNS_CACHE[key] = (time.monotonic() + ttl, value)
+    if isinstance(entry, threading.Event):
+        entry.set()
+    return value
+
+def _cached_getaddrinfo(domain, family, socktype=0, flags=0):
+    """
+    TTL-cached wrapper around socket.getaddrinfo.
+    """
+    return _cached_lookup(
+        (domain, family, socktype, flags),
+        lambda: socket.getaddrinfo(domain, None, family, socktype, 0, flags))
+
+def _addr_family(ip):
+    """
+    Socket family matching a resolved IP literal.
+    """
+    return socket.AF_INET6 if ":" in ip else socket.AF_INET
+
+# Shared resolver, created on first use (dns.resolver stays a deferred
+# import): a bare dns.resolver.resolve() builds a fresh default resolver
+# - re-reading and parsing /etc/resolv.conf - on every call, six times
+# over for one record fan-out
+_RESOLVER = None
+_RESOLVER_LOCK = threading.Lock()
+
+def _get_resolver():
+    """
+    Return the shared DNS resolver, creating it on the first call.
+
+    The resolver parses the system configuration once, bounds each
+    query with a 3s lifetime so one stalled record type cannot hold up
+    a whole fan-out, and carries its own LRU answer cache that absorbs
+    repeats beyond our TTL cache.
+    """
+    global _RESOLVER
+    with _RESOLVER_LOCK:
+        if _RESOLVER is None:
+            import dns.resolver
+            resolver = dns.resolver.Resolver()
+            resolver.lifetime = 3.0
+            resolver.cache = dns.resolver.LRUCache(max_size=1024)
+            _RESOLVER = resolver
+    return _RESOLVER
+
+def _cached_resolve(domain, rtype):
+    """
+    TTL-cached wrapper around the shared resolver.
+    """
+    return _cached_lookup(
+        (domain, rtype),
+        lambda: _get_resolver().resolve(domain, rtype))
+
+def _icmp_checksum(data):
+    """
+    Compute the 16-bit ones-complement checksum of an ICMP packet.
+    """
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack("!%dH" % (len(data) // 2), data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
 
 class WebsiteAnalysis:
-    def __init__(self, domain):
+    def __init__(self, domain, scan_workers=200, scan_timeout=0.3):
         self.domain = domain
         self.os_name = platform.system()
         self.timeout = 5  # Timeout padrão em segundos
+        self.scan_workers = scan_workers  # Workers do escaneamento de portas
+        self.scan_timeout = scan_timeout  # Timeout por porta, em segundos
         self.results_cache = {}  # Cache para resultados de análises
     
     def get_domain_ip(self):
@@ -38,24 +192,44 @@ class WebsiteAnalysis:
             dict: IPv4 and IPv6 addresses.
         """
         ip_info = {"IPv4": "Not available", "IPv6": "Not available"}
-        
-        try:
-            # Get IPv4 address
-            ipv4 = socket.getaddrinfo(self.domain, None, socket.AF_INET)
-            if ipv4:
-                ip_info["IPv4"] = ipv4[0][4][0]
-        except Exception as e:
-            ip_info["IPv4"] = f"Error: {str(e)}"
-        
+
         try:
-            # Get IPv6 address
-            ipv6 = socket.getaddrinfo(self.domain, None, socket.AF_INET6)
-            if ipv6:
-                ip_info["IPv6"] = ipv6[0][4][0]
+            # One AF_UNSPEC query returns both families in a single
+            # round-trip (the resolver batches A+AAAA) instead of two.
+            # SOCK_STREAM deduplicates the STREAM/DGRAM/RAW triplicates
+            # glibc otherwise returns, and AI_ADDRCONFIG skips families
+            # this host has no route for anyway
+            infos = _cached_getaddrinfo(
+                self.domain, socket.AF_UNSPEC, socket.SOCK_STREAM,
+                socket.AI_ADDRCONFIG | socket.AI_NUMERICSERV)
+
+            for family, _type, _proto, _name, sockaddr in infos:
+                if family == socket.AF_INET and ip_info["IPv4"] == "Not available":
+                    ip_info["IPv4"] = sockaddr[0]
+                elif family == socket.AF_INET6 and ip_info["IPv6"] == "Not available":
+                    ip_info["IPv6"] = sockaddr[0]
         except Exception as e:
-            ip_info["IPv6"] = f"Error: {str(e)}"
-            
+            ip_info = {"IPv4": f"Error: {str(e)}", "IPv6": f"Error: {str(e)}"}
+
         return ip_info
+
+    def _resolve_ip(self):
+        """
+        Resolve the domain's IP address once through the cache.
+
+        Prefers IPv4, but falls back to an unrestricted lookup so
+        AAAA-only domains still resolve (to their IPv6 address);
+        callers pick their socket family with _addr_family.
+
+        Returns:
+            str: The IPv4 address, or the IPv6 address when the
+                domain has no A record.
+        """
+        try:
+            infos = _cached_getaddrinfo(self.domain, socket.AF_INET, socket.SOCK_STREAM)
+        except socket.gaierror:
+            infos = _cached_getaddrinfo(self.domain, socket.AF_UNSPEC, socket.SOCK_STREAM)
+        return infos[0][4][0]
     
     def get_dns_records(self):
         """
@@ -64,60 +238,180 @@ class WebsiteAnalysis:
         Returns:
             dict: Dictionary of DNS records by type.
         """
+        # Re-runs within this analyzer's lifetime reuse the first answer
+        cached = self.results_cache.get("dns_records")
+        if cached is not None:
+            return cached
+
         dns_records = {}
         record_types = ["A", "AAAA", "MX", "TXT", "NS", "CNAME"]
-        
-        for record_type in record_types:
-            try:
-                answers = dns.resolver.resolve(self.domain, record_type)
-                dns_records[record_type] = [str(answer) for answer in answers]
-            except Exception:
-                dns_records[record_type] = ["No records found"]
-                
-        return dns_records
+
+        # Fire all record-type queries concurrently: issued serially,
+        # each waits a full resolver round-trip before the next starts
+        # (~6x RTT total); in parallel the whole call costs about one RTT
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(record_types)) as executor:
+            futures = {executor.submit(_cached_resolve, self.domain, record_type): record_type
+                       for record_type in record_types}
+            for future in concurrent.futures.as_completed(futures):
+                record_type = futures[future]
+                try:
+                    answers = future.result()
+                    dns_records[record_type] = [str(answer) for answer in answers]
+                except Exception:
+                    dns_records[record_type] = ["No records found"]
+
+        # Preserve the original record-type ordering in the result
+        result = {record_type: dns_records[record_type] for record_type in record_types}
+        self.results_cache["dns_records"] = result
+        return result
     
     def ping_test(self):
         """
         Perform a ping test to the domain.
-        
+
+        Sends 4 ICMP echo requests directly from this process and times
+        them concurrently, so the whole test costs roughly one RTT
+        instead of the fork per call plus 1s inter-probe spacing of the
+        ping binary, and no locale-dependent output parsing is needed.
+        Falls back to the system ping when raw sockets are unprivileged.
+
+        Returns:
+            dict: Ping statistics including min, avg, max times and packet loss.
+        """
+        try:
+            # Same cached resolution the port scan and SSL check use: the
+            # first caller pays the DNS round-trip, the rest reuse it
+            dest_ip = self._resolve_ip()
+
+            # Probe concurrently instead of sequentially like ping -c 4
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                rtts = list(executor.map(
+                    lambda seq: self._icmp_probe(dest_ip, seq), range(1, 5)))
+        except PermissionError:
+            # Raw ICMP sockets usually require elevated privileges
+            return self._ping_subprocess()
+        except Exception as e:
+            return {"min": 0, "avg": 0, "max": 0, "packet_loss": 100, "error": str(e)}
+
+        received = [rtt for rtt in rtts if rtt is not None]
+        if not received:
+            return {"min": 0, "avg": 0, "max": 0, "packet_loss": 100}
+
+        return {
+            "min": round(min(received), 2),
+            "avg": round(sum(received) / len(received), 2),
+            "max": round(max(received), 2),
+            "packet_loss": int(100 * (len(rtts) - len(received)) / len(rtts))
+        }
+
+    def _icmp_probe(self, dest_ip, seq):
+        """
+        Send one ICMP echo request and wait for the matching reply.
+
+        Args:
+            dest_ip (str): Destination IP address.
+            seq (int): Sequence number embedded in the probe.
+
+        Returns:
+            float: Round-trip time in milliseconds, or None on timeout.
+        """
+        if ":" in dest_ip:
+            # ICMPv6 echo is type 128 / reply 129; the kernel computes
+            # the checksum (it needs the pseudo-header) and delivers
+            # replies without an IP header in front
+            sock = socket.socket(socket.AF_INET6, socket.SOCK_RAW,
+                                 socket.getprotobyname("ipv6-icmp"))
+            req_type, reply_type, ip_header_len = 128, 129, 0
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+            req_type, reply_type, ip_header_len = 8, 0, 20
+        try:
+            ident = os.getpid() & 0xFFFF
+            payload = b"NetworkTool ping"
+            if ip_header_len:
+                header = struct.pack("!BBHHH", req_type, 0, 0, ident, seq)
+                checksum = _icmp_checksum(header + payload)
+            else:
+                checksum = 0
+            packet = struct.pack("!BBHHH", req_type, 0, checksum, ident, seq) + payload
+
+            start = time.perf_counter()
+            sock.sendto(packet, (dest_ip, 0))
+            deadline = start + self.timeout
+
+            # Raw ICMP sockets see every incoming ICMP packet, so keep
+            # reading until our (ident, seq) reply shows up or time runs out
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
+                ready, _, _ = select.select([sock], [], [], remaining)
+                if not ready:
+                    return None
+
+                data, _addr = sock.recvfrom(1024)
+                elapsed = (time.perf_counter() - start) * 1000
+
+                # Skip the IP header (20 bytes on v4, absent on v6)
+                # before matching the echo reply against (ident, seq)
+                if len(data) < ip_header_len + 8:
+                    continue
+                r_type, _code, _cksum, r_ident, r_seq = struct.unpack(
+                    "!BBHHH", data[ip_header_len:ip_header_len + 8])
+                if r_type == reply_type and r_ident == ident and r_seq == seq:
+                    return elapsed
+        finally:
+            sock.close()
+
+    def _ping_subprocess(self):
+        """
+        Ping via the system binary, parsing its output.
+
+        Fallback used when raw ICMP sockets are not permitted.
+
         Returns:
             dict: Ping statistics including min, avg, max times and packet loss.
         """
         ping_stats = {"min": 0, "avg": 0, "max": 0, "packet_loss": 0}
-        
+        count = 4
+
         try:
+            # List args skip the /bin/sh -c fork (and the shell-injection
+            # hazard on an attacker-controlled domain); -W 1 on Linux
+            # bounds a dead host at ~4s instead of ping's default wait
             if self.os_name == "Windows":
-                # Windows ping
-                output = subprocess.check_output(f"ping {self.domain} -n 4", shell=True).decode()
-                
-                # Extract packet loss
-                loss_match = re.search(r"Lost = (\d+)", output)
-                if loss_match:
-                    ping_stats["packet_loss"] = int(loss_match.group(1)) * 25  # 1 lost packet = 25% loss
-                
-                # Extract times
-                times_match = re.search(r"Minimum = (\d+)ms, Maximum = (\d+)ms, Average = (\d+)ms", output)
-                if times_match:
-                    ping_stats["min"] = int(times_match.group(1))
-                    ping_stats["max"] = int(times_match.group(2))
-                    ping_stats["avg"] = int(times_match.group(3))
-                    
+                args = ["ping", self.domain, "-n", str(count)]
             else:
-                # Linux/macOS ping
-                output = subprocess.check_output(f"ping -c 4 {self.domain}", shell=True).decode()
-                
-                # Extract packet loss
-                loss_match = re.search(r"(\d+)% packet loss", output)
-                if loss_match:
-                    ping_stats["packet_loss"] = int(loss_match.group(1))
-                
-                # Extract times
-                times_match = re.search(r"min/avg/max/[^=]+ = (\d+\.\d+)/(\d+\.\d+)/(\d+\.\d+)", output)
-                if times_match:
-                    ping_stats["min"] = float(times_match.group(1))
-                    ping_stats["avg"] = float(times_match.group(2))
-                    ping_stats["max"] = float(times_match.group(3))
-                    
+                args = ["ping", "-c", str(count), "-W", "1", self.domain]
+
+            # Stream replies as ping prints them and aggregate straight
+            # from the per-reply RTTs: no waiting for the summary block,
+            # no regex sweep over the final output, and the child is
+            # terminated as soon as we have enough samples or the
+            # deadline passes
+            rtts = []
+            deadline = time.monotonic() + self.timeout * 4
+            proc = subprocess.Popen(args, stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL, text=True)
+            try:
+                for line in proc.stdout:
+                    match = _RE_PING_RTT.search(line)
+                    if match:
+                        rtts.append(float(match.group(1)))
+                        if len(rtts) >= count:
+                            break
+                    if time.monotonic() > deadline:
+                        break
+            finally:
+                proc.terminate()
+                proc.wait(timeout=5)
+
+            if rtts:
+                ping_stats["min"] = round(min(rtts), 2)
+                ping_stats["avg"] = round(sum(rtts) / len(rtts), 2)
+                ping_stats["max"] = round(max(rtts), 2)
+            ping_stats["packet_loss"] = int(100 * (count - len(rtts)) / count)
+
         except Exception as e:
             ping_stats = {
                 "min": 0,
@@ -126,77 +420,502 @@ class WebsiteAnalysis:
                 "packet_loss": 100,
                 "error": str(e)
             }
-            
+
         return ping_stats
     
-    def scan_single_port(self, port):
+    def scan_single_port(self, ip, port):
         """
         Scan a single port to check if it's open.
-        
+
         Args:
+            ip (str): Pre-resolved IP address to probe.
             port (int): The port number to scan.
-            
+
         Returns:
             tuple: (port, status) where status is "Open" or "Closed".
         """
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex((self.domain, port))
-        if result == 0:
-            sock.close()
-            return (port, "Open")
-        else:
-            sock.close()
-            return (port, "Closed")
-    
+        # Context manager closes the socket on every path (the old code
+        # leaked the descriptor between building the tuple and close())
+        with socket.socket(_addr_family(ip), socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.scan_timeout)
+            result = sock.connect_ex((ip, port))
+        return (port, "Open" if result == 0 else "Closed")
+
     def scan_ports(self, ports):
         """
         Scan multiple ports to check if they're open.
-        
+
+        The probes are pure IO-wait, so a wide worker pool with a short
+        per-port timeout scans even large lists in about one probe
+        interval; the domain is resolved once up front so each probe
+        skips getaddrinfo and connects straight to the IP.
+
         Args:
             ports (list): List of port numbers to scan.
-            
+
         Returns:
             dict: Dictionary with port numbers as keys and status as values.
         """
+        # Large lists go through the single-thread selector path: one
+        # kernel thread per pending SYN doesn't scale past a few hundred
+        if len(ports) > 64:
+            return self.scan_ports_epoll(ports)
+
         results = {}
-        
-        # Use thread pool to scan ports concurrently
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_port = {executor.submit(self.scan_single_port, port): port for port in ports}
-            for future in concurrent.futures.as_completed(future_to_port):
-                port, status = future.result()
+
+        try:
+            ip = self._resolve_ip()
+        except Exception as e:
+            return {port: f"Error: {str(e)}" for port in ports}
+
+        workers = min(self.scan_workers, len(ports)) or 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for port, status in executor.map(lambda p: self.scan_single_port(ip, p), ports):
                 results[port] = status
-                
+
         return results
-    
+
+    # Above this many ports the scan reports only responsive ports: a
+    # full 1-65535 sweep as a port->status dict costs megabytes, and the
+    # display loop would print tens of thousands of "Closed" lines
+    _SPARSE_SCAN_THRESHOLD = 1024
+
+    # Compact per-probe status codes; index matches _PORT_STATUS_NAMES
+    _PORT_CLOSED, _PORT_OPEN, _PORT_FILTERED = 0, 1, 2
+    _PORT_STATUS_NAMES = ("Closed", "Open", "Filtered")
+
+    # Cap on simultaneously open probe sockets. Every in-flight connect
+    # holds a file descriptor until it resolves, so an unbatched wide
+    # sweep blows past RLIMIT_NOFILE (commonly 1024) and dies with
+    # EMFILE; probing in windows of this size stays well under it
+    _SCAN_FD_BUDGET = 512
+
+    def scan_ports_epoll(self, ports):
+        """
+        Scan ports with non-blocking connects driven by one selector.
+
+        Each port gets a non-blocking socket whose connect_ex returns
+        immediately (EINPROGRESS); completion is delivered by the
+        platform selector (epoll on Linux), so hundreds of probes cost
+        about one RTT on a single thread instead of a thread per pending
+        SYN. Ports are probed in windows of _SCAN_FD_BUDGET sockets so
+        the scan never holds more descriptors than the process fd limit
+        allows. Probes still unanswered at the timeout are "Filtered".
+
+        Statuses are tracked in a one-byte-per-port buffer while the
+        scan runs, so a full 65535-port sweep peaks at 64KB of status
+        bookkeeping (plus one window of open sockets) instead of a
+        megabytes-large dict of strings.
+
+        Args:
+            ports (list): List of port numbers to scan.
+
+        Returns:
+            dict: Dictionary with port numbers as keys and status as
+                values. Sweeps wider than _SPARSE_SCAN_THRESHOLD include
+                only Open and Filtered ports; everything omitted is
+                Closed.
+        """
+        try:
+            ip = self._resolve_ip()
+        except Exception as e:
+            return {port: f"Error: {str(e)}" for port in ports}
+
+        statuses = bytearray(len(ports))  # all _PORT_CLOSED
+
+        for start in range(0, len(ports), self._SCAN_FD_BUDGET):
+            stop = min(start + self._SCAN_FD_BUDGET, len(ports))
+            self._scan_batch_epoll(ip, ports, statuses, start, stop)
+
+        names = self._PORT_STATUS_NAMES
+        if len(ports) > self._SPARSE_SCAN_THRESHOLD:
+            # Sparse result: only the ports that answered or were filtered
+            return {port: names[code] for port, code in zip(ports, statuses) if code}
+
+        return {port: names[code] for port, code in zip(ports, statuses)}
+
+    def _scan_batch_epoll(self, ip, ports, statuses, start, stop):
+        """
+        Probe ports[start:stop] on one selector, recording into statuses.
+
+        Args:
+            ip (str): Pre-resolved IP address to probe.
+            ports (list): Full list of port numbers being scanned.
+            statuses (bytearray): Per-port status codes, indexed like ports.
+            start (int): First index of this window (inclusive).
+            stop (int): Last index of this window (exclusive).
+        """
+        sel = selectors.DefaultSelector()
+        sockets = []
+        family = _addr_family(ip)
+        try:
+            for index in range(start, stop):
+                sock = socket.socket(family, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                sockets.append(sock)
+
+                result = sock.connect_ex((ip, ports[index]))
+                if result == 0:
+                    statuses[index] = self._PORT_OPEN
+                elif result in _CONNECT_IN_PROGRESS:
+                    sel.register(sock, selectors.EVENT_WRITE, index)
+                # Anything else stays _PORT_CLOSED
+
+            deadline = time.monotonic() + self.scan_timeout
+            pending = len(sel.get_map())
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _events in sel.select(remaining):
+                    # A writable socket finished connecting; SO_ERROR
+                    # tells open (0) from refused apart
+                    err = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if err == 0:
+                        statuses[key.data] = self._PORT_OPEN
+                    sel.unregister(key.fileobj)
+                    pending -= 1
+
+            # No verdict within the timeout usually means a dropped SYN
+            for key in list(sel.get_map().values()):
+                statuses[key.data] = self._PORT_FILTERED
+                sel.unregister(key.fileobj)
+        finally:
+            sel.close()
+            for sock in sockets:
+                sock.close()
+
+    async def _scan_one_async(self, loop, sem, ip, port):
+        """
+        Probe one port with a non-blocking connect on the event loop.
+
+        Args:
+            loop: The running event loop.
+            sem: Semaphore capping concurrently open probe sockets.
+            ip (str): Pre-resolved IP address to probe.
+            port (int): The port number to scan.
+
+        Returns:
+            tuple: (port, status) where status is "Open" or "Closed".
+        """
+        async with sem:
+            sock = None
+            try:
+                sock = socket.socket(_addr_family(ip), socket.SOCK_STREAM)
+                sock.setblocking(False)
+                await asyncio.wait_for(loop.sock_connect(sock, (ip, port)),
+                                       self.scan_timeout)
+                return (port, "Open")
+            except (OSError, asyncio.TimeoutError):
+                return (port, "Closed")
+            finally:
+                if sock is not None:
+                    sock.close()
+
+    async def _scan_ports_async(self, ip, ports):
+        """
+        Probe every port concurrently on the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        # Same descriptor budget as the selector path: each in-flight
+        # probe holds an fd, so gate the fan-out below RLIMIT_NOFILE
+        sem = asyncio.Semaphore(self._SCAN_FD_BUDGET)
+        results = await asyncio.gather(
+            *[self._scan_one_async(loop, sem, ip, port) for port in ports])
+        return dict(results)
+
+    def scan_ports_async(self, ports):
+        """
+        Event-loop variant of scan_ports for high-fan-out runs.
+
+        Thousands of concurrent connects ride a single thread through
+        the asyncio loop (accelerated by uvloop when installed), with no
+        per-probe thread creation or context-switch cost.
+
+        Args:
+            ports (list): List of port numbers to scan.
+
+        Returns:
+            dict: Dictionary with port numbers as keys and status as values.
+        """
+        try:
+            ip = self._resolve_ip()
+        except Exception as e:
+            return {port: f"Error: {str(e)}" for port in ports}
+
+        return asyncio.run(self._scan_ports_async(ip, ports))
+
+    # Time budget (seconds) for each complete-analysis step: WHOIS can
+    # hang 10s+ on a slow registrar, and without a bound one stuck step
+    # blocked the entire flow
+    _STEP_TIMEOUTS = {
+        "Domain IP": 10,
+        "DNS Records": 10,
+        "Ping Test": 15,
+        "Port Scan": 15,
+        "WHOIS Info": 10,
+        "SSL Info": 10,
+    }
+
+    def complete_analysis(self, on_step_done=None):
+        """
+        Run every analysis step concurrently and collect the results.
+
+        The six steps are independent and latency-bound, so they are
+        submitted together and the whole flow costs about as long as its
+        slowest step (typically WHOIS) instead of the sum of all six.
+        Each step runs under its own timeout, so a stuck leg yields a
+        timeout result while its siblings keep making progress.
+
+        Args:
+            on_step_done: Optional callable invoked with (step_name,
+                finished_count, total_steps) as each step completes.
+
+        Returns:
+            dict: Results keyed by step name.
+        """
+        steps = {
+            "Domain IP": self.get_domain_ip,
+            "DNS Records": self.get_dns_records,
+            "Ping Test": self.ping_test,
+            "Port Scan": lambda: self.scan_ports([80, 443, 8080, 21, 22, 25, 3306]),
+            "WHOIS Info": self.get_whois_info,
+            "SSL Info": self.get_ssl_info,
+        }
+
+        if hasattr(asyncio, "TaskGroup"):
+            results = asyncio.run(self._complete_analysis_async(steps, on_step_done))
+        else:
+            # Python < 3.11: thread pool with per-future timeouts
+            results = self._complete_analysis_threads(steps, on_step_done)
+
+        # Present the steps in their usual order regardless of finish order
+        return {name: results[name] for name in steps}
+
+    async def _complete_analysis_async(self, steps, on_step_done):
+        """
+        Drive the analysis steps as one TaskGroup with per-step timeouts.
+
+        The steps run on a dedicated executor rather than via
+        asyncio.to_thread: wait_for only abandons a timed-out worker, and
+        asyncio.run joins the default executor during loop shutdown, so
+        a hung step would stall the return right after being reported as
+        timed out.
+        """
+        results = {}
+        progress = [0, len(steps)]
+        loop = asyncio.get_running_loop()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(steps))
+
+        async def run_step(name, func):
+            timeout = self._STEP_TIMEOUTS.get(name, self.timeout * 2)
+            try:
+                results[name] = await asyncio.wait_for(
+                    loop.run_in_executor(executor, func), timeout)
+            except asyncio.TimeoutError:
+                results[name] = {"Error": f"timeout after {timeout}s"}
+            except Exception as e:
+                results[name] = {"Error": str(e)}
+            progress[0] += 1
+            if on_step_done is not None:
+                on_step_done(name, progress[0], progress[1])
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for name, func in steps.items():
+                    tg.create_task(run_step(name, func))
+        finally:
+            # Don't join the workers: a timed-out step may still be
+            # blocked inside its library call
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def _complete_analysis_threads(self, steps, on_step_done):
+        """
+        Thread-pool fallback used when asyncio.TaskGroup is unavailable.
+
+        Deadlines are enforced with concurrent.futures.wait: as_completed
+        only ever yields futures that already finished, so a
+        result(timeout=...) inside that loop can never fire and a stuck
+        step would block the whole flow.
+        """
+        results = {}
+        done_count = 0
+        total = len(steps)
+        start = time.monotonic()
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=total)
+        try:
+            futures = {executor.submit(func): name for name, func in steps.items()}
+            deadlines = {
+                future: start + self._STEP_TIMEOUTS.get(name, self.timeout * 2)
+                for future, name in futures.items()
+            }
+            pending = set(futures)
+            while pending:
+                next_deadline = min(deadlines[future] for future in pending)
+                wait_budget = max(0, next_deadline - time.monotonic())
+                finished, pending = concurrent.futures.wait(
+                    pending, timeout=wait_budget,
+                    return_when=concurrent.futures.FIRST_COMPLETED)
+
+                for future in finished:
+                    name = futures[future]
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        results[name] = {"Error": str(e)}
+                    done_count += 1
+                    if on_step_done is not None:
+                        on_step_done(name, done_count, total)
+
+                # Anything past its deadline is reported as a timeout and
+                # abandoned; its worker thread keeps running but no
+                # longer holds up the siblings
+                now = time.monotonic()
+                expired = {future for future in pending if deadlines[future] <= now}
+                for future in expired:
+                    name = futures[future]
+                    timeout = self._STEP_TIMEOUTS.get(name, self.timeout * 2)
+                    results[name] = {"Error": f"timeout after {timeout}s"}
+                    done_count += 1
+                    if on_step_done is not None:
+                        on_step_done(name, done_count, total)
+                pending -= expired
+        finally:
+            # Don't join the workers: a timed-out step may still be
+            # blocked inside its library call
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
     def get_whois_info(self):
         """
         Get WHOIS information for the domain.
-        
+
         Returns:
             dict: WHOIS information.
         """
-        whois_info = {}
-        
+        # WHOIS is the slowest step; the answer is cached per domain at
+        # module level, so re-runs — even from a fresh analyzer for the
+        # same domain — reuse the first good answer instead of paying
+        # another registrar round-trip. Failures are not cached
         try:
-            w = whois.whois(self.domain)
-            
-            # Extract relevant information
-            whois_info = {
-                "Registrar": w.registrar if hasattr(w, 'registrar') else "Unknown",
-                "WHOIS Server": w.whois_server if hasattr(w, 'whois_server') else "Unknown",
-                "Creation Date": self._format_date(w.creation_date),
-                "Expiration Date": self._format_date(w.expiration_date),
-                "Updated Date": self._format_date(w.updated_date),
-                "Name Servers": ", ".join(w.name_servers) if hasattr(w, 'name_servers') and isinstance(w.name_servers, list) else "Unknown"
-            }
-            
+            return _cached_lookup(("whois", self.domain), self._fetch_whois_info,
+                                  ttl=_RESULT_CACHE_TTL)
         except Exception as e:
-            whois_info = {"Error": str(e)}
-            
-        return whois_info
+            return {"Error": str(e)}
+
+    def _fetch_whois_info(self):
+        """
+        Perform the actual WHOIS query and shape the result dict.
+
+        Returns:
+            dict: WHOIS information.
+
+        Raises:
+            Exception: Propagated from the underlying WHOIS query.
+        """
+        # RDAP first: structured JSON over HTTP typically answers in half
+        # the time of a port-43 WHOIS hop and needs no per-registrar
+        # text parsing. Classic WHOIS stays as the fallback for TLDs
+        # without RDAP coverage or when the gateway is unreachable
+        try:
+            return self._rdap_lookup()
+        except Exception:
+            pass
+
+        # python-whois loads its TLD data on import; pay that only when
+        # WHOIS is actually requested
+        import whois
+
+        w = whois.whois(self.domain)
+
+        # WhoisEntry supports mapping access over its parsed fields;
+        # one dict conversion replaces the per-field hasattr probes
+        # (each a full attribute lookup with an exception path)
+        data = w if isinstance(w, dict) else dict(w)
+
+        name_servers = data.get('name_servers') or []
+        if isinstance(name_servers, str):
+            name_servers = [name_servers]
+
+        # Extract relevant information
+        return {
+            "Registrar": data.get('registrar') or "Unknown",
+            "WHOIS Server": data.get('whois_server') or "Unknown",
+            "Creation Date": self._format_date(data.get('creation_date')),
+            "Expiration Date": self._format_date(data.get('expiration_date')),
+            "Updated Date": self._format_date(data.get('updated_date')),
+            "Name Servers": ", ".join(name_servers) if name_servers else "Unknown"
+        }
     
+    def _rdap_lookup(self):
+        """
+        Resolve registration data for the domain over RDAP.
+
+        Queries the rdap.org gateway, which proxies the IANA bootstrap
+        registry, so no TLD-to-server mapping needs to ship here. The
+        result dict has the same keys as the classic WHOIS path.
+
+        Returns:
+            dict: WHOIS-shaped registration information.
+
+        Raises:
+            Exception: On HTTP errors, timeouts or unexpected payloads.
+        """
+        import requests
+
+        response = requests.get(f"https://rdap.org/domain/{self.domain}",
+                                timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+
+        events = {event.get("eventAction"): event.get("eventDate")
+                  for event in data.get("events", [])}
+
+        # The registrar entity carries its display name as the vCard
+        # "fn" (formatted name) field
+        registrar = "Unknown"
+        for entity in data.get("entities", []):
+            if "registrar" in entity.get("roles", []):
+                vcard = entity.get("vcardArray") or [None, []]
+                for field in vcard[1]:
+                    if field and field[0] == "fn":
+                        registrar = field[3]
+                        break
+                break
+
+        name_servers = [ns.get("ldhName", "") for ns in data.get("nameservers", [])]
+
+        return {
+            "Registrar": registrar,
+            "WHOIS Server": data.get("port43") or "Unknown",
+            "Creation Date": self._format_rdap_date(events.get("registration")),
+            "Expiration Date": self._format_rdap_date(events.get("expiration")),
+            "Updated Date": self._format_rdap_date(events.get("last changed")),
+            "Name Servers": ", ".join(filter(None, name_servers)) or "Unknown",
+        }
+
+    def _format_rdap_date(self, value):
+        """
+        Format an RDAP ISO-8601 event date like the WHOIS dates.
+
+        Args:
+            value: ISO-8601 date string or None.
+
+        Returns:
+            str: Formatted date string, or "Unknown" when absent.
+        """
+        if not value:
+            return "Unknown"
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return str(value)
+        return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
     def _format_date(self, date_obj):
         """
         Format a date object or list of date objects to a string.
@@ -221,38 +940,71 @@ class WebsiteAnalysis:
     def get_ssl_info(self):
         """
         Get SSL certificate details for the domain.
-        
+
         Returns:
             dict: SSL certificate information or error message.
         """
+        # Cached per domain at module level with the same TTL as WHOIS:
+        # certificates do not change within an interactive session, and
+        # each fresh handshake costs a full TCP+TLS round-trip
         try:
-            context = ssl.create_default_context()
-            with socket.create_connection((self.domain, 443)) as sock:
-                with context.wrap_socket(sock, server_hostname=self.domain) as ssock:
-                    cert = ssock.getpeercert()
-                    
-                    # Extract certificate information
-                    cert_info = {
-                        "Subject": ", ".join([f"{key}={value}" for key, value in cert['subject'][0]]),
-                        "Issuer": ", ".join([f"{key}={value}" for key, value in cert['issuer'][0]]),
-                        "Version": cert['version'],
-                        "Serial Number": cert['serialNumber'],
-                        "Not Before": cert['notBefore'],
-                        "Not After": cert['notAfter'],
-                    }
-                    
-                    # Check certificate validity
-                    not_after = datetime.strptime(cert['notAfter'], "%b %d %H:%M:%S %Y %Z")
-                    if not_after < datetime.now():
-                        cert_info["Status"] = "Expired"
-                    else:
-                        cert_info["Status"] = "Valid"
-                        
-                    return cert_info
-                    
+            return _cached_lookup(("ssl", self.domain), self._fetch_ssl_info,
+                                  ttl=_RESULT_CACHE_TTL)
         except ssl.SSLError as e:
             return f"SSL Error: {str(e)}"
         except socket.error as e:
             return f"Socket Error: {str(e)}"
         except Exception as e:
             return f"Error: {str(e)}"
+
+    def _fetch_ssl_info(self):
+        """
+        Fetch and parse the server certificate over a fresh TLS handshake.
+
+        Returns:
+            dict: SSL certificate information.
+
+        Raises:
+            ssl.SSLError, socket.error: Propagated from the handshake.
+        """
+        # Connect to the cached IP; SNI still carries the hostname.
+        # The explicit timeout keeps a dead host from blocking for
+        # the OS connect default (~75s)
+        with socket.create_connection((self._resolve_ip(), 443), timeout=self.timeout) as sock:
+            with _SSL_CTX.wrap_socket(sock, server_hostname=self.domain) as ssock:
+                if _x509 is not None:
+                    # Parse the DER bytes once instead of having
+                    # OpenSSL build the Python tuple tree
+                    der = ssock.getpeercert(binary_form=True)
+                    cert = _x509.load_der_x509_certificate(der)
+
+                    not_after = cert.not_valid_after_utc
+                    return {
+                        "Subject": cert.subject.rfc4514_string(),
+                        "Issuer": cert.issuer.rfc4514_string(),
+                        "Version": cert.version.value,
+                        "Serial Number": format(cert.serial_number, 'X'),
+                        "Not Before": cert.not_valid_before_utc.strftime("%Y-%m-%d %H:%M:%S"),
+                        "Not After": not_after.strftime("%Y-%m-%d %H:%M:%S"),
+                        "Status": "Expired" if not_after.timestamp() < time.time() else "Valid",
+                    }
+
+                cert = ssock.getpeercert()
+
+                # Extract certificate information
+                cert_info = {
+                    "Subject": ", ".join([f"{key}={value}" for key, value in cert['subject'][0]]),
+                    "Issuer": ", ".join([f"{key}={value}" for key, value in cert['issuer'][0]]),
+                    "Version": cert['version'],
+                    "Serial Number": cert['serialNumber'],
+                    "Not Before": cert['notBefore'],
+                    "Not After": cert['notAfter'],
+                }
+
+                # Check certificate validity. cert_time_to_seconds is
+                # a tight locale-independent C parser; strptime with
+                # %b both cost more and broke under non-C locales
+                expiry = ssl.cert_time_to_seconds(cert['notAfter'])
+                cert_info["Status"] = "Expired" if expiry < time.time() else "Valid"
+
+                return cert_info
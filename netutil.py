@@ -11,6 +11,7 @@ import sys
 import time
 import click
 import readline  # For command history support
+from collections import deque
 
 from modules.ui import (
     display_main_menu, 
@@ -47,15 +48,16 @@ from modules.network_diagnostics import (
 )
 from modules.export import export_results
 
-# Initialize command history
-command_history = []
+# Initialize command history, bounded to the last 200 commands
+command_history = deque(maxlen=200)
 
 # Store results for potential export
 current_results = {}
 
 def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal screen without forking a subprocess."""
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 def system_info_menu():
     """Display system information submenu and handle selections."""
@@ -18,21 +18,24 @@ Versão: 2.0
 
 import os
 import sys
+import json
+import asyncio
 import click
-import pyfiglet
-from colorama import init, Fore, Style, Back
+import colorama
+from colorama import Fore, Style, Back
 import time
 import socket
 import platform
+from collections import deque
 from datetime import datetime
 
 from modules.system_info import SystemInfo
 from modules.website_analysis import WebsiteAnalysis
 from modules.network_diagnostics import NetworkDiagnostics
 from modules.ui_components import (
-    display_banner, 
+    clear_screen,
+    display_banner,
     display_menu, 
-    display_loading, 
     display_error, 
     confirm_action, 
     display_success, 
@@ -41,12 +44,146 @@ from modules.ui_components import (
 )
 from modules.export import export_results
 
-init(autoreset=True)
+# uvloop (libuv) agenda callbacks de I/O pequenos 2-4x mais rápido que o
+# loop seletor puro-Python, o que pesa quando centenas de sondas
+# concorrentes disputam o loop (scan de portas, varredura de subrede).
+# Opcional: sem o pacote, o loop padrão do asyncio continua valendo
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Habilita o modo VT nativo do console no Windows 10+ em vez de
+# substituir sys.stdout por um proxy que intercepta e traduz cada
+# escrita: o parse das sequências ANSI passa a ser feito pelo próprio
+# console, sem custo por write no Python. Em outros sistemas é um no-op.
+# Cada trecho colorido já termina em Style.RESET_ALL, então o autoreset
+# do init() não é necessário
+colorama.just_fix_windows_console()
+
+# Limitado aos últimos 200 comandos: uma lista cresceria sem limite em
+# sessões longas; o deque tem append O(1) e memória limitada
+command_history = deque(maxlen=200)
+
+# Histórico persistido como JSONL append-only: cada comando vira uma
+# linha no arquivo, então ele sobrevive ao fim do processo e a leitura
+# do comando history consome apenas as últimas linhas, com memória
+# constante independentemente do tamanho acumulado do arquivo
+HISTORY_FILE = os.path.expanduser("~/.netutil_history.jsonl")
+HISTORY_DISPLAY_LIMIT = 50
+
+def _record_command(name, *params):
+    """
+    Registra um comando no histórico em memória e no arquivo JSONL.
+
+    A escrita em disco é melhor-esforço: um filesystem somente leitura
+    não impede o uso da ferramenta.
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    command_history.append((name,) + params + (timestamp,))
+    try:
+        with open(HISTORY_FILE, "a", encoding="utf-8") as history_file:
+            history_file.write(json.dumps(
+                {"cmd": name, "params": list(params), "ts": timestamp}) + "\n")
+    except OSError:
+        pass
+
+def _load_history(limit=HISTORY_DISPLAY_LIMIT):
+    """
+    Carrega as últimas entradas do histórico persistido.
+
+    O deque com maxlen descarta as linhas antigas durante a própria
+    leitura, então o custo de memória é limitado pelas `limit` entradas
+    exibidas, não pelo tamanho do arquivo.
+
+    Returns:
+        list: Tuplas no mesmo formato do histórico em memória.
+    """
+    try:
+        with open(HISTORY_FILE, "r", encoding="utf-8") as history_file:
+            tail = deque(history_file, maxlen=limit)
+    except OSError:
+        return list(command_history)
+
+    entries = []
+    for line in tail:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # Linha truncada por um processo interrompido
+        entries.append((record.get("cmd", "?"),)
+                       + tuple(record.get("params", []))
+                       + (record.get("ts", ""),))
+    return entries or list(command_history)
 
-command_history = []
 VERSION = "2.0"
 AUTHOR = "Network Utility Team"
 
+# Fragmentos ANSI montados uma única vez no import: os cabeçalhos e os
+# loops de exibição reutilizam as strings prontas em vez de reconcatenar
+# Fore/Style a cada redesenho (uma vez por porta em um scan grande)
+SEPARATOR = Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL
+PORT_STATUS_BADGES = {
+    "Open": Fore.GREEN + "Open" + Style.RESET_ALL,
+    "Closed": Fore.RED + "Closed" + Style.RESET_ALL,
+    "Filtered": Fore.RED + "Filtered" + Style.RESET_ALL,
+}
+
+def _echo_block(lines):
+    """
+    Emite várias linhas de resultado com uma única escrita no stdout.
+
+    Blocos grandes (centenas de linhas em um escaneamento de rede)
+    custariam um write() no terminal por linha via click.echo; juntá-las
+    de uma vez amortiza essas escritas em uma só, o que é visível em
+    terminais remotos.
+    """
+    click.echo("\n".join(lines))
+
+# Listas de opções dos menus construídas uma única vez no import: cada
+# redesenho reutiliza a mesma tupla imutável em vez de alocar uma lista
+# nova por iteração do laço de menu
+MAIN_MENU = (
+    "1. System Network Information",
+    "2. Website Analysis",
+    "3. Network Diagnostics",
+    "4. Command History",
+    "0. Exit",
+)
+WEBSITE_MENU = (
+    "1. Domain IP Lookup",
+    "2. DNS Records",
+    "3. Ping Test",
+    "4. Port Scanning",
+    "5. WHOIS Information",
+    "6. SSL Certificate Details",
+    "7. Run All Analyses",
+    "8. Export Results",
+    "9. Back to Main Menu",
+    "0. Exit",
+)
+DIAGNOSTICS_MENU = (
+    "1. Network Speed Test",
+    "2. Latency Check",
+    "3. Packet Loss Analysis",
+    "4. Route Tracing",
+    "5. Network Scan",
+    "6. Run All Diagnostics",
+    "7. Export Results",
+    "8. Back to Main Menu",
+    "0. Exit",
+)
+
+def _format_kv(data, indent="  "):
+    """
+    Formata um dicionário como linhas "chave: valor" em uma única string.
+
+    Um join substitui o par f-string + echo por item: mesma saída com uma
+    fração do bytecode por linha e uma única escrita por bloco.
+    """
+    return "\n".join(f"{indent}{key}: {value}" for key, value in data.items())
+
 @click.group(invoke_without_command=True)
 @click.pass_context
 def cli(ctx):
@@ -60,52 +197,32 @@ def system():
     display_banner("System Information")
     
     # Add to command history
-    command_history.append(("system", datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+    _record_command("system")
     
     system_info = SystemInfo()
-    
-    click.echo(Fore.CYAN + "\n[1/6] Getting local IP addresses..." + Style.RESET_ALL)
-    display_loading(1)
-    local_ips = system_info.get_local_ip()
-    
-    click.echo(Fore.CYAN + "\n[2/6] Getting public IP address..." + Style.RESET_ALL)
-    display_loading(1)
-    public_ip = system_info.get_public_ip()
-    
-    click.echo(Fore.CYAN + "\n[3/6] Getting MAC address..." + Style.RESET_ALL)
-    display_loading(1)
-    mac_address = system_info.get_mac_address()
-    
-    click.echo(Fore.CYAN + "\n[4/6] Getting network interface details..." + Style.RESET_ALL)
-    display_loading(2)
-    interfaces = system_info.get_network_interfaces()
-    
-    click.echo(Fore.CYAN + "\n[5/6] Getting network speed..." + Style.RESET_ALL)
-    display_loading(2)
-    speed = system_info.get_network_speed()
-    
-    click.echo(Fore.CYAN + "\n[6/6] Getting DNS servers..." + Style.RESET_ALL)
-    display_loading(1)
-    dns_servers = system_info.get_dns_servers()
-    
-    # Compile results
-    results = {
-        "Local IPs": local_ips,
-        "Public IP": public_ip,
-        "MAC Address": mac_address,
-        "Network Interfaces": interfaces,
-        "Network Speed": speed,
-        "DNS Servers": dns_servers
+
+    # As seis consultas são independentes e dominadas por espera de rede
+    # ou do sistema, então rodam todas ao mesmo tempo: o tempo total se
+    # aproxima da consulta mais lenta em vez da soma, e cada etapa é
+    # anunciada assim que termina
+    click.echo(Fore.CYAN + "\nCollecting system network information..." + Style.RESET_ALL)
+    steps = {
+        "Local IPs": system_info.get_local_ip,
+        "Public IP": system_info.get_public_ip,
+        "MAC Address": system_info.get_mac_address,
+        "Network Interfaces": system_info.get_network_interfaces,
+        "Network Speed": system_info.get_network_speed,
+        "DNS Servers": system_info.get_dns_servers
     }
-    
+    results = asyncio.run(_gather_system_info(steps))
+
     # Display results
     click.echo("\n" + "="*50)
     click.echo(Fore.GREEN + "SYSTEM NETWORK INFORMATION" + Style.RESET_ALL)
     click.echo("="*50 + "\n")
     
     click.echo(Fore.YELLOW + "LOCAL IP ADDRESSES:" + Style.RESET_ALL)
-    for ip_type, ip in results["Local IPs"].items():
-        click.echo(f"  {ip_type}: {ip}")
+    click.echo(_format_kv(results["Local IPs"]))
     
     click.echo(Fore.YELLOW + "\nPUBLIC IP ADDRESS:" + Style.RESET_ALL)
     click.echo(f"  {results['Public IP']}")
@@ -114,27 +231,45 @@ def system():
     click.echo(f"  {results['MAC Address']}")
     
     click.echo(Fore.YELLOW + "\nNETWORK INTERFACES:" + Style.RESET_ALL)
-    for interface in results["Network Interfaces"]:
-        click.echo(f"  - {interface}")
+    click.echo("\n".join(f"  - {interface}" for interface in results["Network Interfaces"]))
     
     click.echo(Fore.YELLOW + "\nCURRENT NETWORK SPEED:" + Style.RESET_ALL)
     click.echo(f"  Download: {results['Network Speed']['download']} Mbps")
     click.echo(f"  Upload: {results['Network Speed']['upload']} Mbps")
     
     click.echo(Fore.YELLOW + "\nDNS SERVERS:" + Style.RESET_ALL)
-    for server in results["DNS Servers"]:
-        click.echo(f"  - {server}")
+    click.echo("\n".join(f"  - {server}" for server in results["DNS Servers"]))
     
     # Ask for export
     if confirm_action("\nDo you want to export these results?"):
         filename = export_results(results, "system_info")
         display_success(f"Results exported to {filename}")
     
-    if confirm_action("\nReturn to main menu?"):
-        main_menu()
-    else:
+    # Retorna ao laço de main_menu em vez de reentrar nele recursivamente
+    if not confirm_action("\nReturn to main menu?"):
         sys.exit(0)
 
+async def _gather_system_info(steps):
+    """
+    Executa as consultas de informações do sistema em paralelo.
+
+    Cada getter bloqueante roda em uma thread própria via asyncio.to_thread
+    e todas as esperas se sobrepõem com asyncio.gather. O progresso é
+    reportado conforme cada consulta termina, e a ordem do dicionário de
+    entrada é preservada no resultado.
+    """
+    total = len(steps)
+    progress = [0]
+
+    async def run_step(name, func):
+        value = await asyncio.to_thread(func)
+        progress[0] += 1
+        click.echo(Fore.CYAN + f"[{progress[0]}/{total}] {name} done" + Style.RESET_ALL)
+        return name, value
+
+    pairs = await asyncio.gather(*(run_step(name, func) for name, func in steps.items()))
+    return dict(pairs)
+
 @cli.command()
 @click.option('--domain', '-d', prompt='Enter domain name', help='Domain to analyze')
 def website(domain):
@@ -142,7 +277,7 @@ def website(domain):
     display_banner("Website Analysis")
     
     # Add to command history
-    command_history.append(("website", domain, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+    _record_command("website", domain)
     
     analyzer = WebsiteAnalysis(domain)
     results = {}
@@ -150,48 +285,30 @@ def website(domain):
     # Menu for website analysis
     while True:
         # Header com estilo minimalista
-        click.echo("\n" + Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL)
+        click.echo("\n" + SEPARATOR)
         click.echo(Fore.WHITE + Style.BRIGHT + f"WEBSITE ANALYSIS FOR: {domain}" + Style.RESET_ALL)
-        click.echo(Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL + "\n")
+        click.echo(SEPARATOR + "\n")
         
-        options = [
-            "1. Domain IP Lookup",
-            "2. DNS Records",
-            "3. Ping Test",
-            "4. Port Scanning",
-            "5. WHOIS Information",
-            "6. SSL Certificate Details",
-            "7. Run All Analyses",
-            "8. Export Results",
-            "9. Back to Main Menu",
-            "0. Exit"
-        ]
-        
-        choice = display_menu("Select an option:", options)
+        choice = display_menu("Select an option:", WEBSITE_MENU)
         
         if choice == "1":
             click.echo(Fore.CYAN + "\nPerforming Domain IP Lookup..." + Style.RESET_ALL)
-            display_loading(1)
             ip_info = analyzer.get_domain_ip()
             results["Domain IP"] = ip_info
             click.echo(Fore.YELLOW + "\nDOMAIN IP LOOKUP:" + Style.RESET_ALL)
-            for ip_type, ip in ip_info.items():
-                click.echo(f"  {ip_type}: {ip}")
+            click.echo(_format_kv(ip_info))
                 
         elif choice == "2":
             click.echo(Fore.CYAN + "\nGetting DNS Records..." + Style.RESET_ALL)
-            display_loading(2)
             dns_records = analyzer.get_dns_records()
             results["DNS Records"] = dns_records
             click.echo(Fore.YELLOW + "\nDNS RECORDS:" + Style.RESET_ALL)
-            for record_type, records in dns_records.items():
-                click.echo(f"  {record_type}:")
-                for record in records:
-                    click.echo(f"    - {record}")
+            click.echo("\n".join(
+                f"  {record_type}:\n" + "\n".join(f"    - {record}" for record in records)
+                for record_type, records in dns_records.items()))
                     
         elif choice == "3":
             click.echo(Fore.CYAN + "\nPerforming Ping Test..." + Style.RESET_ALL)
-            display_loading(2)
             ping_results = analyzer.ping_test()
             results["Ping Test"] = ping_results
             click.echo(Fore.YELLOW + "\nPING TEST RESULTS:" + Style.RESET_ALL)
@@ -205,99 +322,94 @@ def website(domain):
             port_list = [int(p.strip()) for p in ports.split(",")]
             
             click.echo(Fore.CYAN + f"\nScanning ports {ports}..." + Style.RESET_ALL)
-            display_loading(3)
-            port_results = analyzer.scan_ports(port_list)
+            # Todas as portas são sondadas de uma vez no event loop: as
+            # conexões pendentes se sobrepõem e a varredura custa cerca de
+            # um timeout, independente da quantidade de portas
+            port_results = analyzer.scan_ports_async(port_list)
             results["Port Scan"] = port_results
             
             click.echo(Fore.YELLOW + "\nPORT SCAN RESULTS:" + Style.RESET_ALL)
             for port, status in port_results.items():
-                status_color = Fore.GREEN if status == "Open" else Fore.RED
-                click.echo(f"  Port {port}: {status_color}{status}{Style.RESET_ALL}")
+                badge = PORT_STATUS_BADGES.get(status, Fore.RED + status + Style.RESET_ALL)
+                click.echo(f"  Port {port}: {badge}")
                 
         elif choice == "5":
             click.echo(Fore.CYAN + "\nGetting WHOIS Information..." + Style.RESET_ALL)
-            display_loading(2)
             whois_info = analyzer.get_whois_info()
             results["WHOIS Info"] = whois_info
             
             click.echo(Fore.YELLOW + "\nWHOIS INFORMATION:" + Style.RESET_ALL)
-            for key, value in whois_info.items():
-                click.echo(f"  {key}: {value}")
+            click.echo(_format_kv(whois_info))
                 
         elif choice == "6":
             click.echo(Fore.CYAN + "\nChecking SSL Certificate..." + Style.RESET_ALL)
-            display_loading(2)
             ssl_info = analyzer.get_ssl_info()
             results["SSL Info"] = ssl_info
             
             click.echo(Fore.YELLOW + "\nSSL CERTIFICATE DETAILS:" + Style.RESET_ALL)
             if isinstance(ssl_info, dict):
-                for key, value in ssl_info.items():
-                    click.echo(f"  {key}: {value}")
+                click.echo(_format_kv(ssl_info))
             else:
                 click.echo(f"  {ssl_info}")
                 
         elif choice == "7":
             click.echo(Fore.CYAN + "\nRunning All Analyses..." + Style.RESET_ALL)
-            
-            click.echo(Fore.CYAN + "\n[1/6] Domain IP Lookup..." + Style.RESET_ALL)
-            display_loading(1)
-            results["Domain IP"] = analyzer.get_domain_ip()
-            
-            click.echo(Fore.CYAN + "\n[2/6] DNS Records..." + Style.RESET_ALL)
-            display_loading(1)
-            results["DNS Records"] = analyzer.get_dns_records()
-            
-            click.echo(Fore.CYAN + "\n[3/6] Ping Test..." + Style.RESET_ALL)
-            display_loading(1)
-            results["Ping Test"] = analyzer.ping_test()
-            
-            click.echo(Fore.CYAN + "\n[4/6] Port Scanning (common ports)..." + Style.RESET_ALL)
-            display_loading(2)
-            results["Port Scan"] = analyzer.scan_ports([80, 443, 8080, 21, 22, 25, 3306])
-            
-            click.echo(Fore.CYAN + "\n[5/6] WHOIS Information..." + Style.RESET_ALL)
-            display_loading(1)
-            results["WHOIS Info"] = analyzer.get_whois_info()
-            
-            click.echo(Fore.CYAN + "\n[6/6] SSL Certificate..." + Style.RESET_ALL)
-            display_loading(1)
-            results["SSL Info"] = analyzer.get_ssl_info()
-            
+
+            # Todas as seis etapas rodam em paralelo; cada uma é anunciada
+            # quando termina, então o fluxo inteiro custa o tempo da etapa
+            # mais lenta em vez da soma de todas
+            def _report_step(step, done, total):
+                click.echo(Fore.CYAN + f"[{done}/{total}] {step} done" + Style.RESET_ALL)
+
+            results.update(analyzer.complete_analysis(_report_step))
+
             # Display combined results
             display_banner(f"Analysis Results: {domain}")
-            
-            click.echo(Fore.YELLOW + "\nDOMAIN IP LOOKUP:" + Style.RESET_ALL)
+
+            # Monta o relatório inteiro em memória e o emite de uma vez
+            lines = [Fore.YELLOW + "\nDOMAIN IP LOOKUP:" + Style.RESET_ALL]
             for ip_type, ip in results["Domain IP"].items():
-                click.echo(f"  {ip_type}: {ip}")
-            
-            click.echo(Fore.YELLOW + "\nDNS RECORDS:" + Style.RESET_ALL)
+                lines.append(f"  {ip_type}: {ip}")
+
+            lines.append(Fore.YELLOW + "\nDNS RECORDS:" + Style.RESET_ALL)
             for record_type, records in results["DNS Records"].items():
-                click.echo(f"  {record_type}:")
+                if isinstance(records, str):
+                    # Etapa expirada/falha: o valor é a mensagem de erro
+                    lines.append(f"  {record_type}: {records}")
+                    continue
+                lines.append(f"  {record_type}:")
                 for record in records:
-                    click.echo(f"    - {record}")
-            
-            click.echo(Fore.YELLOW + "\nPING TEST RESULTS:" + Style.RESET_ALL)
-            click.echo(f"  Min: {results['Ping Test']['min']} ms")
-            click.echo(f"  Avg: {results['Ping Test']['avg']} ms")
-            click.echo(f"  Max: {results['Ping Test']['max']} ms")
-            click.echo(f"  Packet Loss: {results['Ping Test']['packet_loss']}%")
-            
-            click.echo(Fore.YELLOW + "\nPORT SCAN RESULTS:" + Style.RESET_ALL)
+                    lines.append(f"    - {record}")
+
+            lines.append(Fore.YELLOW + "\nPING TEST RESULTS:" + Style.RESET_ALL)
+            ping_result = results["Ping Test"]
+            if "Error" in ping_result:
+                # Etapa expirada/falha: só existe a chave Error, então as
+                # chaves fixas de estatística não podem ser indexadas
+                lines.append(f"  Error: {ping_result['Error']}")
+            else:
+                lines.append(f"  Min: {ping_result['min']} ms")
+                lines.append(f"  Avg: {ping_result['avg']} ms")
+                lines.append(f"  Max: {ping_result['max']} ms")
+                lines.append(f"  Packet Loss: {ping_result['packet_loss']}%")
+
+            lines.append(Fore.YELLOW + "\nPORT SCAN RESULTS:" + Style.RESET_ALL)
             for port, status in results["Port Scan"].items():
-                status_color = Fore.GREEN if status == "Open" else Fore.RED
-                click.echo(f"  Port {port}: {status_color}{status}{Style.RESET_ALL}")
-            
-            click.echo(Fore.YELLOW + "\nWHOIS INFORMATION:" + Style.RESET_ALL)
+                badge = PORT_STATUS_BADGES.get(status, Fore.RED + status + Style.RESET_ALL)
+                lines.append(f"  Port {port}: {badge}")
+
+            lines.append(Fore.YELLOW + "\nWHOIS INFORMATION:" + Style.RESET_ALL)
             for key, value in results["WHOIS Info"].items():
-                click.echo(f"  {key}: {value}")
-            
-            click.echo(Fore.YELLOW + "\nSSL CERTIFICATE DETAILS:" + Style.RESET_ALL)
+                lines.append(f"  {key}: {value}")
+
+            lines.append(Fore.YELLOW + "\nSSL CERTIFICATE DETAILS:" + Style.RESET_ALL)
             if isinstance(results["SSL Info"], dict):
                 for key, value in results["SSL Info"].items():
-                    click.echo(f"  {key}: {value}")
+                    lines.append(f"  {key}: {value}")
             else:
-                click.echo(f"  {results['SSL Info']}")
+                lines.append(f"  {results['SSL Info']}")
+
+            _echo_block(lines)
                 
         elif choice == "8":
             if not results:
@@ -308,7 +420,6 @@ def website(domain):
             display_success(f"Results exported to {filename}")
             
         elif choice == "9":
-            main_menu()
             return
             
         elif choice == "0":
@@ -323,7 +434,7 @@ def diagnostics():
     display_banner("Network Diagnostics")
     
     # Add to command history
-    command_history.append(("diagnostics", datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+    _record_command("diagnostics")
     
     diagnostic = NetworkDiagnostics()
     results = {}
@@ -331,27 +442,14 @@ def diagnostics():
     # Menu for network diagnostics
     while True:
         # Header com estilo minimalista
-        click.echo("\n" + Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL)
+        click.echo("\n" + SEPARATOR)
         click.echo(Fore.WHITE + Style.BRIGHT + "NETWORK DIAGNOSTICS" + Style.RESET_ALL)
-        click.echo(Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL + "\n")
-        
-        options = [
-            "1. Network Speed Test",
-            "2. Latency Check",
-            "3. Packet Loss Analysis",
-            "4. Route Tracing",
-            "5. Network Scan",
-            "6. Run All Diagnostics",
-            "7. Export Results",
-            "8. Back to Main Menu",
-            "0. Exit"
-        ]
+        click.echo(SEPARATOR + "\n")
         
-        choice = display_menu("Select an option:", options)
+        choice = display_menu("Select an option:", DIAGNOSTICS_MENU)
         
         if choice == "1":
             click.echo(Fore.CYAN + "\nRealizando Teste de Velocidade da Rede..." + Style.RESET_ALL)
-            display_loading(5)
             speed_results = diagnostic.speed_test()
             results["Speed Test"] = speed_results
             
@@ -361,7 +459,6 @@ def diagnostics():
         elif choice == "2":
             host = click.prompt("Enter host to check latency (default: google.com)", default="google.com")
             click.echo(Fore.CYAN + f"\nChecking Latency to {host}..." + Style.RESET_ALL)
-            display_loading(3)
             latency_results = diagnostic.latency_check(host)
             results["Latency Check"] = latency_results
             
@@ -373,7 +470,6 @@ def diagnostics():
             packets = click.prompt("Number of packets to send", default=50, type=int)
             
             click.echo(Fore.CYAN + f"\nPerforming Packet Loss Analysis ({packets} packets to {host})..." + Style.RESET_ALL)
-            display_loading(4)
             packet_results = diagnostic.packet_loss_analysis(host, packets)
             results["Packet Loss"] = packet_results
             
@@ -384,13 +480,18 @@ def diagnostics():
             host = click.prompt("Enter host to trace route (default: google.com)", default="google.com")
             
             click.echo(Fore.CYAN + f"\nTracing Route to {host}..." + Style.RESET_ALL)
-            display_loading(6)
-            route_results = diagnostic.route_tracing(host)
-            results["Route Tracing"] = route_results
-            
             click.echo(Fore.YELLOW + f"\nROUTE TRACING RESULTS ({host}):" + Style.RESET_ALL)
-            for hop in route_results:
-                click.echo(f"  Hop {hop['hop']}: {hop['host']} ({hop['ip']}) - {hop['time']} ms")
+
+            # Cada hop é exibido no momento em que o traceroute o reporta,
+            # em vez de esperar o rastreamento completo (até ~30s)
+            route_results = []
+            try:
+                for hop in diagnostic.route_tracing_stream(host):
+                    route_results.append(hop)
+                    click.echo(f"  Hop {hop['hop']}: {hop['host']} ({hop['ip']}) - {hop['time']} ms")
+            except Exception as e:
+                display_error(f"Route tracing failed: {str(e)}")
+            results["Route Tracing"] = route_results
                 
         elif choice == "5":
             # Network Scan
@@ -400,46 +501,38 @@ def diagnostics():
             scan_results = diagnostic.network_scan(subnet)
             results["Network Scan"] = scan_results
             
-            # Exibe resultados
-            click.echo(Fore.YELLOW + f"\nRESULTADOS DO ESCANEAMENTO DE REDE ({subnet}):" + Style.RESET_ALL)
-            click.echo(f"  Total de IPs escaneados: {scan_results['total_scanned']}")
-            
+            # Exibe resultados; as linhas dos dispositivos são emitidas com
+            # uma única escrita em vez de um write() por dispositivo
+            lines = [Fore.YELLOW + f"\nRESULTADOS DO ESCANEAMENTO DE REDE ({subnet}):" + Style.RESET_ALL,
+                     f"  Total de IPs escaneados: {scan_results['total_scanned']}"]
+
             if "error" in scan_results:
-                click.echo(Fore.RED + f"  Erro: {scan_results['error']}" + Style.RESET_ALL)
+                lines.append(Fore.RED + f"  Erro: {scan_results['error']}" + Style.RESET_ALL)
             else:
-                click.echo(f"  Dispositivos ativos encontrados: {len(scan_results['active_devices'])}")
-                
+                lines.append(f"  Dispositivos ativos encontrados: {len(scan_results['active_devices'])}")
+
                 if scan_results['active_devices']:
-                    click.echo("\n  " + Fore.GREEN + "DISPOSITIVOS ATIVOS:" + Style.RESET_ALL)
+                    lines.append("\n  " + Fore.GREEN + "DISPOSITIVOS ATIVOS:" + Style.RESET_ALL)
                     for device in scan_results['active_devices']:
                         hostname = device['hostname']
                         hostname_display = f" ({hostname})" if hostname != "N/A" else ""
-                        click.echo(f"    • {device['ip']}{hostname_display} - {device['status']}")
+                        lines.append(f"    • {device['ip']}{hostname_display} - {device['status']}")
                 else:
-                    click.echo("\n  " + Fore.YELLOW + "Nenhum dispositivo ativo encontrado na rede." + Style.RESET_ALL)
+                    lines.append("\n  " + Fore.YELLOW + "Nenhum dispositivo ativo encontrado na rede." + Style.RESET_ALL)
+
+            _echo_block(lines)
                     
         elif choice == "6":
             click.echo(Fore.CYAN + "\nRunning All Diagnostics..." + Style.RESET_ALL)
-            
-            click.echo(Fore.CYAN + "\n[1/5] Network Speed Test..." + Style.RESET_ALL)
-            display_loading(5)
-            results["Speed Test"] = diagnostic.speed_test()
-            
-            click.echo(Fore.CYAN + "\n[2/5] Latency Check (google.com)..." + Style.RESET_ALL)
-            display_loading(3)
-            results["Latency Check"] = diagnostic.latency_check("google.com")
-            
-            click.echo(Fore.CYAN + "\n[3/5] Packet Loss Analysis (google.com)..." + Style.RESET_ALL)
-            display_loading(4)
-            results["Packet Loss"] = diagnostic.packet_loss_analysis("google.com", 50)
-            
-            click.echo(Fore.CYAN + "\n[4/5] Route Tracing (google.com)..." + Style.RESET_ALL)
-            display_loading(6)
-            results["Route Tracing"] = diagnostic.route_tracing("google.com")
-            
-            click.echo(Fore.CYAN + "\n[5/5] Network Scan (local)..." + Style.RESET_ALL)
-            results["Network Scan"] = diagnostic.network_scan()
-            
+
+            # Os cinco diagnósticos rodam em paralelo; cada um é anunciado
+            # quando termina, então o fluxo inteiro custa o tempo da etapa
+            # mais lenta em vez da soma de todas
+            def _report_step(step, done, total):
+                click.echo(Fore.CYAN + f"[{done}/{total}] {step} done" + Style.RESET_ALL)
+
+            results.update(diagnostic.complete_diagnostics(on_step_done=_report_step))
+
             # Display combined results
             display_banner("Network Diagnostics Results")
             
@@ -462,38 +555,41 @@ def diagnostics():
             # Exibir todos os resultados em um formato consistente
             display_multi_result("DIAGNOSTIC SUMMARY", diagnostic_results)
             
-            # Resultados de rastreamento de rota com estilo minimalista
-            click.echo("\n" + Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL)
-            click.echo(Fore.WHITE + Style.BRIGHT + "ROUTE TRACING RESULTS (google.com)" + Style.RESET_ALL)
-            click.echo(Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL + "\n")
-            
+            # Resultados de rastreamento de rota com estilo minimalista;
+            # cada seção é montada em memória e emitida com uma única escrita
+            lines = ["\n" + SEPARATOR,
+                     Fore.WHITE + Style.BRIGHT + "ROUTE TRACING RESULTS (google.com)" + Style.RESET_ALL,
+                     SEPARATOR + "\n"]
+
             for hop in results["Route Tracing"]:
-                click.echo(Fore.WHITE + f"  Hop {hop['hop']}: " + 
-                           Style.BRIGHT + f"{hop['host']}" + Style.RESET_ALL + 
-                           Fore.WHITE + Style.DIM + f" ({hop['ip']})" + Style.RESET_ALL +
-                           f" - {hop['time']} ms")
-            
+                lines.append(Fore.WHITE + f"  Hop {hop['hop']}: " +
+                             Style.BRIGHT + f"{hop['host']}" + Style.RESET_ALL +
+                             Fore.WHITE + Style.DIM + f" ({hop['ip']})" + Style.RESET_ALL +
+                             f" - {hop['time']} ms")
+
             # Exibe resultados do escaneamento de rede
             scan_results = results["Network Scan"]
-            click.echo("\n" + Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL)
-            click.echo(Fore.WHITE + Style.BRIGHT + "NETWORK SCAN RESULTS" + Style.RESET_ALL)
-            click.echo(Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL + "\n")
-            
-            click.echo(Fore.WHITE + f"  Total de IPs escaneados: " + Style.BRIGHT + f"{scan_results['total_scanned']}" + Style.RESET_ALL)
-            
+            lines += ["\n" + SEPARATOR,
+                      Fore.WHITE + Style.BRIGHT + "NETWORK SCAN RESULTS" + Style.RESET_ALL,
+                      SEPARATOR + "\n"]
+
+            lines.append(Fore.WHITE + f"  Total de IPs escaneados: " + Style.BRIGHT + f"{scan_results['total_scanned']}" + Style.RESET_ALL)
+
             if "error" in scan_results:
-                click.echo(Fore.WHITE + Style.DIM + f"  Erro: {scan_results['error']}" + Style.RESET_ALL)
+                lines.append(Fore.WHITE + Style.DIM + f"  Erro: {scan_results['error']}" + Style.RESET_ALL)
             else:
-                click.echo(Fore.WHITE + f"  Dispositivos ativos encontrados: " + 
-                           Style.BRIGHT + f"{len(scan_results['active_devices'])}" + Style.RESET_ALL)
-                
+                lines.append(Fore.WHITE + f"  Dispositivos ativos encontrados: " +
+                             Style.BRIGHT + f"{len(scan_results['active_devices'])}" + Style.RESET_ALL)
+
                 # Exibir detalhes dos dispositivos ativos
                 if len(scan_results['active_devices']) > 0:
-                    click.echo(Fore.WHITE + Style.DIM + "\n  Dispositivos ativos:" + Style.RESET_ALL)
+                    lines.append(Fore.WHITE + Style.DIM + "\n  Dispositivos ativos:" + Style.RESET_ALL)
                     for i, device in enumerate(scan_results['active_devices'], 1):
-                        click.echo(Fore.WHITE + f"    {i}. " + Style.BRIGHT + f"{device['ip']}" + Style.RESET_ALL + 
-                                  Fore.WHITE + Style.DIM + f" {device.get('hostname', 'Desconhecido')}" + Style.RESET_ALL)
-                
+                        lines.append(Fore.WHITE + f"    {i}. " + Style.BRIGHT + f"{device['ip']}" + Style.RESET_ALL +
+                                     Fore.WHITE + Style.DIM + f" {device.get('hostname', 'Desconhecido')}" + Style.RESET_ALL)
+
+            _echo_block(lines)
+
         elif choice == "7":
             if not results:
                 display_error("No results to export. Run some diagnostics first.")
@@ -503,7 +599,6 @@ def diagnostics():
             display_success(f"Results exported to {filename}")
             
         elif choice == "8":
-            main_menu()
             return
             
         elif choice == "0":
@@ -518,14 +613,18 @@ def history():
     display_banner("Command History")
     
     # Header com estilo minimalista
-    click.echo("\n" + Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL)
+    click.echo("\n" + SEPARATOR)
     click.echo(Fore.WHITE + Style.BRIGHT + "COMMAND HISTORY" + Style.RESET_ALL)
-    click.echo(Fore.WHITE + Style.DIM + "─"*50 + Style.RESET_ALL + "\n")
+    click.echo(SEPARATOR + "\n")
     
-    if not command_history:
+    # Lê do arquivo persistido (últimas HISTORY_DISPLAY_LIMIT entradas),
+    # então o histórico inclui também as sessões anteriores
+    entries = _load_history()
+
+    if not entries:
         click.echo(Fore.WHITE + Style.DIM + "No commands have been executed yet." + Style.RESET_ALL)
     else:
-        for i, cmd in enumerate(command_history, 1):
+        for i, cmd in enumerate(entries, 1):
             if len(cmd) == 2:  # Commands without additional parameters
                 command, timestamp = cmd
                 click.echo(Fore.WHITE + f"{i}. " + Fore.WHITE + Style.DIM + f"[{timestamp}]" + 
@@ -537,44 +636,37 @@ def history():
     
     click.echo("\nPress Enter to return to main menu...")
     input()
-    main_menu()
 
 def main_menu():
     """Display the main menu and handle user input."""
-    os.system('cls' if os.name == 'nt' else 'clear')
-    display_banner("Network Utility Tool")
-    
-    options = [
-        "1. System Network Information",
-        "2. Website Analysis",
-        "3. Network Diagnostics",
-        "4. Command History",
-        "0. Exit"
-    ]
-    
-    choice = display_menu("Select an option:", options)
-    
-    if choice == "1":
-        system()
-    elif choice == "2":
-        domain = input(Fore.WHITE + Style.DIM + "Enter domain name: " + Style.RESET_ALL)
-        website(domain)
-    elif choice == "3":
-        diagnostics()
-    elif choice == "4":
-        history()
-    elif choice == "0":
-        click.echo(Fore.WHITE + Style.DIM + "\nThank you for using Network Utility Tool. Goodbye!" + Style.RESET_ALL)
-        sys.exit(0)
-    else:
-        display_error("Invalid option. Please try again.")
-        main_menu()
+    # Laço explícito em vez de recursão mútua com os subcomandos: cada
+    # volta de submenu empilhava um novo frame de main_menu, crescendo a
+    # pilha sem limite durante a navegação e mantendo os locals de cada
+    # frame (analisadores, dicionários de resultado) vivos contra o GC.
+    # Os subcomandos agora simplesmente retornam para este laço.
+    # Invocamos os callbacks diretamente: chamar o objeto Command do click
+    # executaria Command.main() em modo standalone, que levanta SystemExit
+    # ao final do callback e derrubaria o processo na volta ao menu.
+    while True:
+        clear_screen()
+        display_banner("Network Utility Tool")
+
+        choice = display_menu("Select an option:", MAIN_MENU)
 
-# Register commands
-cli.add_command(system)
-cli.add_command(website)
-cli.add_command(diagnostics)
-cli.add_command(history)
+        if choice == "1":
+            system.callback()
+        elif choice == "2":
+            domain = input(Fore.WHITE + Style.DIM + "Enter domain name: " + Style.RESET_ALL)
+            website.callback(domain)
+        elif choice == "3":
+            diagnostics.callback()
+        elif choice == "4":
+            history.callback()
+        elif choice == "0":
+            click.echo(Fore.WHITE + Style.DIM + "\nThank you for using Network Utility Tool. Goodbye!" + Style.RESET_ALL)
+            sys.exit(0)
+        else:
+            display_error("Invalid option. Please try again.")
 
 if __name__ == "__main__":
     try: